@@ -1,50 +1,124 @@
-from setuptools import setup, find_packages
+import compileall
 import os
+import pickle
+import re
+import sys
+from pathlib import Path
 
-# Read requirements from requirements.txt
-with open('requirements.txt') as f:
-    required = f.read().splitlines()
+from setuptools import setup
+from setuptools.command.install_lib import install_lib
 
-# Read long description from README.md
-with open("README.md", "r", encoding="utf-8") as fh:
-    long_description = fh.read()
+HERE = Path(__file__).parent
+
+
+def _read(path):
+    return (HERE / path).read_text(encoding="utf-8")
+
+
+# Parsed requirements, reused across the repeated setup.py runs of a single build
+REQS_CACHE = HERE / "__pycache__" / "setup_reqs.pkl"
+
+
+def _reqs():
+    path = HERE / "requirements.txt"
+    st = path.stat()
+    key = (st.st_mtime_ns, st.st_size)
+    try:
+        with open(REQS_CACHE, "rb") as f:
+            cached_key, reqs = pickle.load(f)
+        if cached_key == key:
+            return reqs
+    except (OSError, EOFError, ValueError, pickle.UnpicklingError):
+        pass
+
+    # Skip blank lines, comments and pip options such as "-r other.txt" or "-e .",
+    # which are not valid install_requires entries
+    with open(path, encoding="utf-8") as f:
+        reqs = [
+            req for req in (line.strip() for line in f)
+            if req and not req.startswith(("#", "-"))
+        ]
+
+    try:
+        REQS_CACHE.parent.mkdir(exist_ok=True)
+        with open(REQS_CACHE, "wb") as f:
+            pickle.dump((key, reqs), f, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError:
+        pass  # read-only source tree; just parse again next time
+    return reqs
+
+
+# Requirements that only specific pipeline stages need, grouped by extra.
+# Everything else in requirements.txt is a core dependency.
+EXTRAS = {
+    "cluster": {"scikit-learn", "numpy", "scipy", "hdbscan"},
+    "embed": {"sentence-transformers", "huggingface-hub"},
+    "speedups": {"uvloop", "pyahocorasick", "selectolax"},
+    "onnx": {"optimum"},
+    "ann": {"hnswlib"},
+}
+
+DEV_REQUIRES = [
+    "pytest>=6.0",
+    "pytest-cov>=2.0",
+    "black>=22.0",
+    "flake8>=3.9",
+]
+
+
+def _split_reqs():
+    core = []
+    extras = {name: [] for name in EXTRAS}
+    for req in _reqs():
+        project = re.split(r"[<>=!~;\[ ]", req, maxsplit=1)[0].lower().replace("_", "-")
+        extra = next((name for name, projects in EXTRAS.items() if project in projects), None)
+        (extras[extra] if extra else core).append(req)
+    extras["all"] = [req for name in EXTRAS for req in extras[name]]
+    extras["dev"] = DEV_REQUIRES
+    return core, extras
+
+
+class ParallelInstallLib(install_lib):
+    """Byte-compile the installed package in parallel, at the default and -OO levels."""
+
+    def byte_compile(self, files):
+        if sys.dont_write_bytecode or not self.compile or self.dry_run:
+            return super().byte_compile(files)
+
+        # Compile only the top-level packages and modules this install wrote;
+        # install_dir itself is all of site-packages for --user and legacy installs
+        install_dir = Path(self.install_dir)
+        targets = sorted({
+            install_dir / Path(f).relative_to(install_dir).parts[0]
+            for f in files if f.endswith(".py")
+        })
+        # With --root, embed the paths the files will have on the target system
+        root = self.get_finalized_command("install").root
+        for target in targets:
+            ddir = str(target if target.is_dir() else target.parent)
+            if root and ddir.startswith(root):
+                ddir = ddir[len(root.rstrip(os.sep)):]
+            if target.is_dir():
+                compileall.compile_dir(target, ddir=ddir, quiet=1, workers=0, optimize=[0, 2])
+            else:
+                compileall.compile_file(target, ddir=ddir, quiet=1, optimize=[0, 2])
+
+
+# Static metadata lives in pyproject.toml; only the fields declared dynamic there
+# are computed here.
+INSTALL_REQUIRES, EXTRAS_REQUIRE = _split_reqs()
+
+# The long description is only published with built distributions; skip reading
+# README.md for metadata-only and editable/develop runs.
+NEEDS_README = any(
+    cmd in sys.argv for cmd in ("sdist", "bdist", "bdist_wheel", "register", "upload", "check")
+)
 
 setup(
-    name="meridian-news-aggregator",
-    version="0.1.0",
-    author="Stephen A. Hedrick",
-    author_email="Stephen@wavebound.io",
-    description="An intelligent RSS news aggregator with advanced clustering and ranking capabilities",
-    long_description=long_description,
+    long_description=_read("README.md") if NEEDS_README else "",
     long_description_content_type="text/markdown",
-    url="https://github.com/CartesianXR7/meridian",
-    packages=find_packages(where="src"),
-    package_dir={"": "src"},
-    classifiers=[
-        "Development Status :: 3 - Alpha",
-        "Intended Audience :: Developers",
-        "Topic :: Text Processing :: General",
-        "License :: OSI Approved :: MIT License",
-        "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.9",
-        "Programming Language :: Python :: 3.10",
-        "Programming Language :: Python :: 3.11",
-        "Operating System :: OS Independent",
-    ],
-    python_requires=">=3.9",
-    install_requires=required,
-    entry_points={
-        'console_scripts': [
-            'meridian=meridian.aggregator:main',
-        ],
-    },
-    include_package_data=True,
-    extras_require={
-        'dev': [
-            'pytest>=6.0',
-            'pytest-cov>=2.0',
-            'black>=22.0',
-            'flake8>=3.9',
-        ],
-    },
+    install_requires=INSTALL_REQUIRES,
+    extras_require=EXTRAS_REQUIRE,
+    cmdclass={"install_lib": ParallelInstallLib},
+    options={"bdist_wheel": {"python_tag": "py3"}},
 )
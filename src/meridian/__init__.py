@@ -3,20 +3,48 @@ Meridian Insights
 ================
 
 A powerful RSS news aggregator with advanced clustering and ranking capabilities.
+
+Import the public API from its submodule, e.g.
+`from meridian.meridian import cluster_articles`.
 """
 
-__version__ = "0.4.0"
+import functools
+import importlib
+import warnings
+
 __author__ = "Stephen A. Hedrick"
 __email__ = "Stephen@wavebound.io"
 
-from .meridian import (
-    MeridianAggregator,
-    parse_sources_from_headlines,
-    CustomJSONEncoder,
-)
-
-__all__ = [
-    "MeridianAggregator",
-    "parse_sources_from_headlines",
-    "CustomJSONEncoder",
-]
+# Deprecated top-level re-exports and the module each one now lives in. They are
+# still resolved lazily for one release, with a DeprecationWarning.
+_DEPRECATED_EXPORTS = {
+    "CustomJSONEncoder": "._json",
+    "parse_sources_from_headlines": "._sources",
+}
+
+
+@functools.cache
+def _version() -> str:
+    # The installed distribution metadata is the single source of truth
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        return version("meridian-news-aggregator")
+    except PackageNotFoundError:
+        return "0.0.0+unknown"
+
+
+def __getattr__(name):
+    if name == "__version__":
+        return _version()
+    if name == "utils":
+        return importlib.import_module(".utils", __name__)
+    if name in _DEPRECATED_EXPORTS:
+        warnings.warn(
+            f"Importing {name} from 'meridian' is deprecated; "
+            f"import it from 'meridian.meridian' directly",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        return getattr(importlib.import_module(_DEPRECATED_EXPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
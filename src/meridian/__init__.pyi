@@ -0,0 +1,9 @@
+from . import utils as utils
+
+# Deprecated: import these from meridian.meridian instead
+from ._json import CustomJSONEncoder as CustomJSONEncoder
+from ._sources import parse_sources_from_headlines as parse_sources_from_headlines
+
+__version__: str
+__author__: str
+__email__: str
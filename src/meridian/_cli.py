@@ -0,0 +1,37 @@
+"""
+Entry point for the `meridian` console script.
+
+Handles the trivial flags itself so that `meridian --version` and
+`meridian --help` return without importing the aggregator and its
+NLP/clustering dependencies.
+"""
+
+import sys
+
+USAGE = """usage: meridian [-h] [-V]
+
+Fetch the configured RSS feeds, cluster and score the headlines, and send the
+Meridian Insights email.
+
+options:
+  -h, --help     show this help message and exit
+  -V, --version  show the installed version and exit
+"""
+
+
+def main():
+    args = sys.argv[1:]
+    if args and args[0] in ("--version", "-V"):
+        from . import __version__
+        print(__version__)
+        return 0
+    if args and args[0] in ("--help", "-h"):
+        print(USAGE, end="")
+        return 0
+
+    from .meridian import main as _main
+    return _main()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
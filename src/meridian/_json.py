@@ -0,0 +1,26 @@
+"""
+JSON serialization helpers for Meridian output.
+
+Kept separate from meridian.meridian so that `meridian.CustomJSONEncoder` can be
+resolved without importing the aggregator and its NLP/clustering dependencies.
+"""
+
+import json
+from datetime import date, datetime
+
+
+class CustomJSONEncoder(json.JSONEncoder):
+    """
+    JSON encoder for the values produced by the aggregation pipeline:
+    datetimes/dates (ISO 8601), sets (lists) and NumPy scalars/arrays.
+    """
+
+    def default(self, obj):
+        if isinstance(obj, (datetime, date)):
+            return obj.isoformat()
+        if isinstance(obj, (set, frozenset)):
+            return list(obj)
+        # NumPy scalars and arrays, detected without importing NumPy
+        if hasattr(obj, "tolist"):
+            return obj.tolist()
+        return super().default(obj)
@@ -0,0 +1,30 @@
+"""
+Lightweight helpers for reading source attributions back out of aggregated
+headlines, importable without loading the aggregator.
+"""
+
+import re
+from typing import Dict, List
+
+# Matches the hyperlinks built for "sources_str", e.g. <a href="URL">Reuters</a>
+_SOURCE_LINK_RE = re.compile(r'<a href="([^"]*)">(.*?)</a>')
+
+
+def parse_sources_from_headlines(headlines: List[Dict]) -> List[List[Dict]]:
+    """
+    Extracts the linked sources from each aggregated headline.
+
+    Parameters:
+    - headlines (List[Dict]): Aggregated headlines carrying a "sources_str" value.
+
+    Returns:
+    - List[List[Dict]]: For each headline, a list of {"name", "url"} dicts in the
+      order the sources appear.
+    """
+    return [
+        [
+            {"name": name, "url": url}
+            for url, name in _SOURCE_LINK_RE.findall(headline.get("sources_str") or "")
+        ]
+        for headline in headlines
+    ]
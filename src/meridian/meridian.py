@@ -23,63 +23,86 @@ Features:
 
 import os
 import re
+import math
 import ssl
+import html
 import json
-import numpy as np
 import asyncio
-import subprocess
+import hashlib
+import sqlite3
+from functools import cached_property, lru_cache
+from operator import itemgetter
+from concurrent.futures import ProcessPoolExecutor
 from tqdm import tqdm
 from tqdm.asyncio import tqdm
-from typing import List, Dict
+from typing import List, Dict, Optional
 from collections import defaultdict
 
-from datetime import datetime, timedelta, date
+from datetime import datetime, timedelta
 from dateutil import parser as date_parser
 from dateutil import tz
 import pycountry
-from zoneinfo import ZoneInfo
 from urllib.parse import urlparse
-from googletrans import Translator
 
 import feedparser
 from bs4 import BeautifulSoup
 
-from sentence_transformers import SentenceTransformer
-from transformers import pipeline
-from transformers import AutoTokenizer, AutoModelForSeq2SeqLM
 from ftfy import fix_text as ftfy_fix_text
 
-import spacy
-from fuzzywuzzy import fuzz
+from rapidfuzz import fuzz, utils as fuzz_utils
 import nltk
 from nltk.corpus import stopwords
 from nltk.sentiment.vader import SentimentIntensityAnalyzer
 from nltk.tokenize import word_tokenize
-nltk.download('punkt')
-nltk.download('averaged_perceptron_tagger')
-nltk.download('stopwords')
-nltk.download('vader_lexicon')
 
-import language_tool_python
 import contractions
 import tldextract
 
-import torch
-from sklearn.cluster import DBSCAN
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
-from sklearn.cluster import AgglomerativeClustering
 from newspaper import Article
 
-from aiohttp import ClientSession
+from aiohttp import ClientSession, ClientTimeout, TCPConnector
 from collections import defaultdict, Counter
 
 import smtplib
 from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
 from email_validator import validate_email, EmailNotValidError
 import logging
 
+# Re-exported for backwards compatibility
+from ._json import CustomJSONEncoder
+from ._sources import parse_sources_from_headlines
+from .utils import lazy_import
+from .utils.optionals import (
+    HAS_AHOCORASICK,
+    HAS_CLD3,
+    HAS_HNSWLIB,
+    HAS_LXML,
+    HAS_OPTIMUM,
+    HAS_SCIPY,
+    HAS_SELECTOLAX,
+    HAS_SENTENCE_TRANSFORMERS,
+    HAS_SKLEARN,
+    HAS_TORCH,
+    HAS_TRANSFORMERS,
+    HAS_UVLOOP,
+)
+
+# NumPy and scikit-learn are only needed once clustering runs
+# (pip install meridian-news-aggregator[cluster])
+np = lazy_import("numpy")
+sklearn_text = lazy_import("sklearn.feature_extraction.text")
+scipy_sparse = lazy_import("scipy.sparse")
+scipy_csgraph = lazy_import("scipy.sparse.csgraph")
+
+# spaCy and the translator are loaded on first use by their getters below
+spacy = lazy_import("spacy")
+googletrans = lazy_import("googletrans")
+
+# Embedding and text generation models (pip install meridian-news-aggregator[embed])
+torch = lazy_import("torch")
+transformers = lazy_import("transformers")
+sentence_transformers = lazy_import("sentence_transformers")
+
 
 # Set up logging
 logging.basicConfig(
@@ -92,10 +115,10 @@ logging.basicConfig(
 )
 
 # Initialize global variables
-nlp = None
 # redis_client = None
-translator = None
 
+# Headlines and descriptions repeat across feeds, so memoize the expansion
+@lru_cache(maxsize=1 << 16)
 def fix_contractions(text):
     return contractions.fix(text)
 
@@ -113,158 +136,244 @@ def divider() -> str:
     # Return an HTML divider
     return "<hr style='border:1px solid #ccc;'>\n"
 
-# Initialize the grammar tool
-tool = language_tool_python.LanguageTool('en-US')
+# Where NLTK data is downloaded; point NLTK_DATA at a persistent volume so the
+# downloads survive container restarts
+NLTK_DATA_DIR = os.environ.get("NLTK_DATA", "/tmp/nltk_data")
+
+# NLTK resources the pipeline uses, by their path inside the data directory
+NLTK_RESOURCES = {
+    "punkt": "tokenizers/punkt",
+    "averaged_perceptron_tagger": "taggers/averaged_perceptron_tagger",
+    "stopwords": "corpora/stopwords",
+    "vader_lexicon": "sentiment/vader_lexicon.zip",
+}
+
+
+def ensure_nltk_data(resources=tuple(NLTK_RESOURCES)):
+    # Only hit the network for resources that aren't installed yet
+    for resource in resources:
+        try:
+            nltk.data.find(NLTK_RESOURCES[resource])
+        except LookupError:
+            logging.info(f"Downloading NLTK resource '{resource}'")
+            nltk.download(resource, download_dir=NLTK_DATA_DIR, quiet=True)
+
 
 def initialize_resources():
-    global nlp, translator, sentiment_analyzer, s3_client
-    # redis_client,
+    if NLTK_DATA_DIR not in nltk.data.path:
+        nltk.data.path.append(NLTK_DATA_DIR)
 
-    nltk.data.path.append("/tmp/nltk_data")
+    ensure_nltk_data()
 
-    subprocess.run(["python", "-m", "spacy", "download", "en_core_web_sm"], check=True)
 
-    # Load spaCy model
-    nlp = spacy.load("en_core_web_sm")
+# Heavy models are created on first use and shared for the rest of the process
+@lru_cache(maxsize=1)
+def get_nlp():
+    try:
+        return spacy.load("en_core_web_sm")
+    except OSError as e:
+        raise OSError(
+            "spaCy model 'en_core_web_sm' is not installed; "
+            "run 'python -m spacy download en_core_web_sm'"
+        ) from e
 
-    # Initialize Google Translator
-    translator = Translator()
 
-    nltk.download("stopwords", download_dir="/tmp/nltk_data")
+@lru_cache(maxsize=1)
+def get_translator():
+    # Initialize Google Translator
+    return googletrans.Translator()
 
-    # Ensure the VADER lexicon is downloaded
-    nltk.download("vader_lexicon", download_dir="/tmp/nltk_data")
 
+@lru_cache(maxsize=1)
+def get_vader():
     # Initialize the VADER sentiment analyzer
     sentiment_analyzer = SentimentIntensityAnalyzer()
 
     # Update VADER lexicon with custom words specific to major news headlines
-    new_words = {
-        "catastrophe": -3.5,
-        "disaster": -3.0,
-        "explosion": -3.0,
-        "explosions": -3.0,
-        "blows up": -3.0,
-        "war": -3.0,
-        "tragedy": -3.0,
-        "collapse": -3.0,
-        "hurricane": -3.0,
-        "earthquake": -3.0,
-        "shooting": -3.0,
-        "terrorist": -3.0,
-        "fraud": -3.0,
-        "impeach": -3.0,
-        "impeached": -3.0,
-        "impeachment": -3.0,
-        "impeaches": -3.0,
-        "attack": -2.5,
-        "cyberattack": -2.5,
-        "defeat": -2.5,
-        "failure": -2.5,
-        "fail": -2.5,
-        "crash": -2.5,
-        "recession": -2.5,
-        "pandemic": -2.5,
-        "plummet": -2.5,
-        "conflict": -2.5,
-        "flood": -2.5,
-        "disinformation": -2.5,
-        "urgent": -2.5,
-        "security probe": -2.5,
-        "critical": -2.0,
-        "breaking": -2.0,
-        "decline": -2.0,
-        "wildfire": -2.0,
-        "critical condition": -2.0,
-        "brace for": -2.0,
-        "hemoraging": -2.0,
-        "braces for": -2.0,
-        "loss": -2.0,
-        "leak": -2.0,
-        "siezes": -2.0,
-        "low growth": -2.0,
-        "high debt": -2.0,
-        "weigh on": -2.0,
-        "imminent risk": -2.0,
-        "famine": -2.0,
-        "virus": -2.0,
-        "afraid": -2.0,
-        "accident": -2.0,
-        "nonexistent": -2.0,
-        "storm": -2.0,
-        "shocked": -2.0,
-        "recall": -2.0,
-        "recalls": -2.0,
-        "could impact": -2.0,
-        "explosions": -2.0,
-        "explosion": -2.0,
-        "drought": -2.0,
-        "killed": -2.0,
-        "alert": -1.5,
-        "bailout": -1.5,
-        "sanctions on": -1.5,
-        "to cut up to": -1.5,
-        "strike": -1.5,
-        "hospitalized": -1.5,
-        "antisemitic": -1.5,
-        "trump": -1.5,
-        "putin": -1.5,
-        "nazi": -1.5,
-        "nazis": -1.5,
-        "protest": -1.5,
-        "gap is growing": -1.5,
-        "controversial": -1.0,
-        "despite": -1.0,
-        "migrants": -1.0,
-        "condemn": -1.0,
-        "racist": -1.0,
-        "rubio": -1.0,
-        "gaetz": -1.0,
-        "gabbard": -1.0,
-        "thune": -1.0,
-        "ramaswamy": -1.0,
-        "musk": -1.0,
-        "flood": -1.0,
-        "tax": -1.0,
-        "react to": -1.0,
-        "taxes": -1.0,
-        "capital gains": -1.0,
-        "plunge": -1.0,
-        "disappointing": -1.0,
-        "warning": -1.0,
-        "closing": -1.0,
-        "raising": -1.0,
-        "faces at least": -1.0,
-        "plot": -1.0,
-        "assasination": -1.0,
-        "to invest": 1.0,
-        "nasa": 1.0,
-        "launch of": 1.0,
-        "launching": 1.0,
-        "moon": 1.0,
-        "stars": 1.0,
-        "surge": 1.5,
-        "help": 1.5,
-        "invest": 1.5,
-        "soar": 2.0,
-        "soars": 2.0,
-        "new high": 2.0,
-        "launches": 2.0,
-        "expedition": 2.0,
-        "making it easier": 2.0,
-        "gain": 2.0,
-        "making it easier to": 2.0,
-        "win": 2.0,
-        "soars": 2.0,
-        "growth": 2.0,
-        "breakthrough": 2.5,
-        "success": 2.5,
-        "victory": 2.5,
-        "turnout": 3,
-        "nuclear power": 3,
-        # Add more words as needed
-    }
-    sentiment_analyzer.lexicon.update(new_words)
+    sentiment_analyzer.lexicon.update(NEWS_LEXICON)
+    return sentiment_analyzer
+
+
+def embedding_device() -> str:
+    # Prefer a GPU for the encoder's forward pass when one is available
+    if HAS_TORCH:
+        if torch.cuda.is_available():
+            return "cuda"
+        if torch.backends.mps.is_available():
+            return "mps"
+    return "cpu"
+
+
+@lru_cache(maxsize=1)
+def get_sbert(model_name: str):
+    device = embedding_device()
+    if device == "cpu" and HAS_OPTIMUM:
+        # On CPU, an int8-quantized ONNX Runtime export is several times faster
+        try:
+            return OnnxEncoder(model_name)
+        except Exception as e:
+            logging.warning(f"ONNX encoder unavailable, using PyTorch on CPU: {e}")
+    if device == "cpu":
+        # Some environments default torch to a single thread; encoding short
+        # titles is compute-bound, so give intra-op parallelism every core
+        torch.set_num_threads(EMBED_THREADS)
+        try:
+            torch.set_num_interop_threads(max(1, EMBED_THREADS // 4))
+        except RuntimeError:
+            # Can only be set before torch runs any parallel work
+            pass
+    model = sentence_transformers.SentenceTransformer(model_name, device=device)
+    # Headlines are short; capping the sequence length (default 256) avoids
+    # running the transformer over padding
+    model.max_seq_length = EMBED_MAX_SEQ_LENGTH
+    return model
+
+
+# Custom sentiment valences for words and phrases common in major news headlines
+NEWS_LEXICON = {
+    "catastrophe": -3.5,
+    "disaster": -3.0,
+    "blows up": -3.0,
+    "war": -3.0,
+    "tragedy": -3.0,
+    "collapse": -3.0,
+    "hurricane": -3.0,
+    "earthquake": -3.0,
+    "shooting": -3.0,
+    "terrorist": -3.0,
+    "fraud": -3.0,
+    "impeach": -3.0,
+    "impeached": -3.0,
+    "impeachment": -3.0,
+    "impeaches": -3.0,
+    "attack": -2.5,
+    "cyberattack": -2.5,
+    "defeat": -2.5,
+    "failure": -2.5,
+    "fail": -2.5,
+    "crash": -2.5,
+    "recession": -2.5,
+    "pandemic": -2.5,
+    "plummet": -2.5,
+    "conflict": -2.5,
+    "disinformation": -2.5,
+    "urgent": -2.5,
+    "security probe": -2.5,
+    "critical": -2.0,
+    "breaking": -2.0,
+    "decline": -2.0,
+    "wildfire": -2.0,
+    "critical condition": -2.0,
+    "brace for": -2.0,
+    "hemoraging": -2.0,
+    "braces for": -2.0,
+    "loss": -2.0,
+    "leak": -2.0,
+    "siezes": -2.0,
+    "low growth": -2.0,
+    "high debt": -2.0,
+    "weigh on": -2.0,
+    "imminent risk": -2.0,
+    "famine": -2.0,
+    "virus": -2.0,
+    "afraid": -2.0,
+    "accident": -2.0,
+    "nonexistent": -2.0,
+    "storm": -2.0,
+    "shocked": -2.0,
+    "recall": -2.0,
+    "recalls": -2.0,
+    "could impact": -2.0,
+    "explosions": -2.0,
+    "explosion": -2.0,
+    "drought": -2.0,
+    "killed": -2.0,
+    "alert": -1.5,
+    "bailout": -1.5,
+    "sanctions on": -1.5,
+    "to cut up to": -1.5,
+    "strike": -1.5,
+    "hospitalized": -1.5,
+    "antisemitic": -1.5,
+    "trump": -1.5,
+    "putin": -1.5,
+    "nazi": -1.5,
+    "nazis": -1.5,
+    "protest": -1.5,
+    "gap is growing": -1.5,
+    "controversial": -1.0,
+    "despite": -1.0,
+    "migrants": -1.0,
+    "condemn": -1.0,
+    "racist": -1.0,
+    "rubio": -1.0,
+    "gaetz": -1.0,
+    "gabbard": -1.0,
+    "thune": -1.0,
+    "ramaswamy": -1.0,
+    "musk": -1.0,
+    "flood": -1.0,
+    "tax": -1.0,
+    "react to": -1.0,
+    "taxes": -1.0,
+    "capital gains": -1.0,
+    "plunge": -1.0,
+    "disappointing": -1.0,
+    "warning": -1.0,
+    "closing": -1.0,
+    "raising": -1.0,
+    "faces at least": -1.0,
+    "plot": -1.0,
+    "assasination": -1.0,
+    "to invest": 1.0,
+    "nasa": 1.0,
+    "launch of": 1.0,
+    "launching": 1.0,
+    "moon": 1.0,
+    "stars": 1.0,
+    "surge": 1.5,
+    "help": 1.5,
+    "invest": 1.5,
+    "soar": 2.0,
+    "soars": 2.0,
+    "new high": 2.0,
+    "launches": 2.0,
+    "expedition": 2.0,
+    "making it easier": 2.0,
+    "gain": 2.0,
+    "making it easier to": 2.0,
+    "win": 2.0,
+    "growth": 2.0,
+    "breakthrough": 2.5,
+    "success": 2.5,
+    "victory": 2.5,
+    "turnout": 3,
+    "nuclear power": 3,
+    # Add more words as needed
+}
+
+# VADER splits text on whitespace, so multi-word entries above never match
+# through its lexicon; score them with one precompiled alternation instead,
+# longest phrase first so "making it easier to" wins over "making it easier"
+NEWS_PHRASES = {phrase: score for phrase, score in NEWS_LEXICON.items() if " " in phrase}
+_NEWS_PHRASE_RE = re.compile(
+    r"\b(?:"
+    + "|".join(re.escape(phrase) for phrase in sorted(NEWS_PHRASES, key=len, reverse=True))
+    + r")\b"
+)
+
+
+def phrase_score(headline_lower: str) -> float:
+    """
+    Sums the valences of the multi-word NEWS_LEXICON phrases in a headline.
+
+    Parameters:
+    - headline_lower (str): The lowercased headline.
+
+    Returns:
+    - float: The summed valence, 0.0 if no phrase matches.
+    """
+    return sum(NEWS_PHRASES[m.group(0)] for m in _NEWS_PHRASE_RE.finditer(headline_lower))
 
 
 rss_feeds = [
@@ -370,7 +479,6 @@ rss_feeds = [
     "https://www.consumerfinance.gov/about-us/newsroom/feed/",
     "https://www.chicagofed.org/forms/rss/NewsReleases",
     "https://www.aba.com/rss/press",
-    "https://www.federalreserve.gov/feeds/press_all.xml", # fed press all
     "https://www.federalreserve.gov/feeds/press_monetary.xml", # fed monetary press all
     "https://www.federalreserve.gov/feeds/Data/H15_H15_RIFSPFF_N.B.XML", # fed funds
     "https://www.federalreserve.gov/feeds/Data/H15_H15_RIFSRP_F02_N.B.XML", # discount rate release
@@ -407,7 +515,6 @@ rss_feeds = [
     "https://www.artificialintelligence-news.com/feed/",
     "https://lastweekin.ai/feed",
     "https://feeds.feedburner.com/RBloggers",
-    "https://news.mit.edu/topic/mitmachine-learning-rss.xml", 
     "https://feeds.feedburner.com/blogspot/gJZg",
     "https://www.reddit.com/r/machinelearningnews/hot/.rss",
     "https://www.automotive-iq.com/rss/categories/cybersecurity",
@@ -421,7 +528,6 @@ rss_feeds = [
     "https://www.manufacturingtomorrow.com/rss/news/",
     "https://feeds.feedburner.com/biometricupdate",
     "https://www.finextra.com/rss/headlines.aspx",
-    "https://www.manufacturingtomorrow.com/rss/news/",
     "https://feeds.feedburner.com/sc247/rss/news",
     "https://dataprivacymanager.net/feed",
     "https://www.earthquakenewstoday.com/feed/",
@@ -470,7 +576,6 @@ rss_feeds = [
     "https://www.barchart.com/news/rss/financials",
     "https://www.barchart.com/news/authors/rss",
     "https://biztoc.com/feed",
-    "https://feeds.feedburner.com/InformationIsBeautiful",
     "https://www.bitdefender.com/nuxt/api/en-us/rss/hotforsecurity/industry-news/",
     "https://bluepurple.binaryfirefly.com/feed",
     "https://www.cyberdefensemagazine.com/feed/",
@@ -502,14 +607,43 @@ rss_feeds = [
 #    "https://www.sciencedaily.com/rss/computers_math/artificial_intelligence.xml",
 ]
 
+# Guard against the same feed being listed twice, which would fetch it twice and
+# feed duplicate articles into clustering; keeps the first occurrence's order
+rss_feeds = list(dict.fromkeys(rss_feeds))
+
+
+# Compiled once; a negated character class avoids the backtracking of "<.*?>"
+_TAG_RE = re.compile(r"<[^>]+>")
+
 
 def clean_html(raw_html):
-    cleanr = re.compile("<.*?>")
-    return re.sub(cleanr, "", raw_html)
+    return _TAG_RE.sub("", raw_html)
 
 
 def extract_text_from_html(html_content):
-    soup = BeautifulSoup(html_content, "html.parser")
+    # selectolax's lexbor parser builds and walks the tree in C, well over an
+    # order of magnitude faster than BeautifulSoup; the text is joined the way
+    # get_text(separator=" ", strip=True) joins it, leaving out scripts and styles
+    if HAS_SELECTOLAX:
+        from selectolax.lexbor import LexborHTMLParser
+
+        tree = LexborHTMLParser(html_content)
+        tree.strip_tags(["script", "style"])
+        if tree.root is None:
+            return ""
+        return " ".join(
+            filter(
+                None,
+                (
+                    node.text_content.strip()
+                    for node in tree.root.traverse(include_text=True)
+                    if node.tag == "-text"
+                ),
+            )
+        )
+
+    # lxml's C parser is much faster than html.parser on short feed bodies
+    soup = BeautifulSoup(html_content, "lxml" if HAS_LXML else "html.parser")
     return soup.get_text(separator=" ", strip=True)
 
 
@@ -523,14 +657,33 @@ def preprocess_text(text: str) -> str:
     Returns:
     - str: The preprocessed text.
     """
-    doc = nlp(text)
+    doc = get_nlp()(text)
     return ' '.join([token.lemma_ for token in doc if not token.is_stop and not token.is_punct])
 
 
 
-def extract_entities(text: str) -> List[str]:
-    doc = nlp(text)
-    return [ent.text for ent in doc.ents]
+def extract_entities_batch(
+    titles: List[str], batch_size: int = 128, n_process: int = 1
+) -> List[List[str]]:
+    """
+    Extracts named entities from each title, running only the components NER
+    depends on.
+
+    Parameters:
+    - titles (List[str]): The titles to extract entities from.
+    - batch_size (int): Number of titles spaCy processes per batch.
+    - n_process (int): Worker processes spaCy shards the batches across.
+
+    Returns:
+    - List[List[str]]: The entity texts for each title, in input order.
+    """
+    docs = get_nlp().pipe(
+        titles,
+        batch_size=batch_size,
+        n_process=n_process,
+        disable=["parser", "lemmatizer", "tagger"],
+    )
+    return [[ent.text for ent in doc.ents] for doc in docs]
 
 
 async def fetch_feed(session, feed_url: str) -> str:
@@ -546,24 +699,51 @@ async def fetch_feed(session, feed_url: str) -> str:
         return None
 
 
-async def fetch_all_feeds(rss_feeds: List[str]) -> List[str]:
-    async with ClientSession() as session:
-        tasks = [fetch_feed(session, feed_url) for feed_url in rss_feeds]
-        return await asyncio.gather(*tasks)
+# Cap on simultaneous feed downloads, and per-request timeouts so one slow feed
+# can't stall the whole fetch
+MAX_CONCURRENT_FEEDS = 32
+FEED_TIMEOUT = ClientTimeout(total=15, connect=5)
 
 
-def process_article(entry, feed_url: str) -> Dict:
+def feed_session() -> ClientSession:
+    # Shared, pooled HTTP session for feed downloads
+    connector = TCPConnector(
+        limit=MAX_CONCURRENT_FEEDS, ttl_dns_cache=300, enable_cleanup_closed=True
+    )
+    return ClientSession(
+        connector=connector,
+        timeout=FEED_TIMEOUT,
+        headers={"Accept-Encoding": "gzip, deflate"},
+    )
+
+
+def parse_feed(feed_content: str):
+    # Runs in a worker process, so the result is pickled back to the parent. A
+    # malformed feed's bozo_exception (e.g. a SAXParseException) can't be
+    # pickled, so only its message is kept
+    feed = feedparser.parse(feed_content)
+    if "bozo_exception" in feed:
+        feed["bozo_exception"] = str(feed["bozo_exception"])
+    return feed
+
+
+def build_entry(entry, feed_url: str) -> Dict:
     if not hasattr(entry, "link"):
         return None
 
     article_url = entry.link
 
+    title = entry.get("title", "Untitled Article")
+    # Normalized once here; downstream counting and matching read this key
+    title_norm = title.strip().lower()
+
     article_data = {
-        "title": entry.get("title", "Untitled Article"),
+        "title": title,
         "url": article_url,
         "publish_date": entry.get("published", entry.get("updated", "")),
         "source": feed_url,
-        "content": ''
+        "content": '',
+        "_title_norm": title_norm,
     }
 
     # Try to get the content from the entry
@@ -572,21 +752,41 @@ def process_article(entry, feed_url: str) -> Dict:
         article_data['content'] = extract_text_from_html(content)
     elif 'summary' in entry and entry.summary:
         article_data['content'] = extract_text_from_html(entry.summary)
-    else:
-        article_data['content'] = ''
 
-    # If content is still empty, fetch the article
-    if not article_data['content'].strip():
+    return article_data
+
+
+# Download full article pages for entries whose feed carries no content
+ENABLE_FULL_TEXT = os.environ.get("ENABLE_FULL_TEXT", "").lower() in ("1", "true", "yes")
+
+
+async def fill_missing_content(session, articles: List[Dict]) -> None:
+    """
+    Fills in empty article content by downloading each page through the shared
+    session and extracting its text with newspaper, without newspaper's own
+    blocking download.
+
+    Parameters:
+    - session (ClientSession): The open HTTP session.
+    - articles (List[Dict]): Articles whose 'content' is empty; updated in place.
+    """
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_FEEDS)
+
+    async def fetch_page(article_url):
+        async with semaphore:
+            return await fetch_feed(session, article_url)
+
+    pages = await asyncio.gather(*[fetch_page(article["url"]) for article in articles])
+    for article_data, page in zip(articles, pages):
+        if not page:
+            continue
         try:
-            article = Article(article_url)
-            article.download()
+            article = Article(article_data["url"])
+            article.set_html(page)
             article.parse()
             article_data['content'] = article.text
         except Exception as e:
-            logging.error(f"Error fetching content from {article_url}: {e}")
-            article_data['content'] = ''
-
-    return article_data
+            logging.error(f"Error extracting content from {article_data['url']}: {e}")
 
 #    if 'content' in entry:
 #        content = entry.content[0].value if isinstance(entry.content, list) else entry.content
@@ -606,39 +806,153 @@ def process_article(entry, feed_url: str) -> Dict:
 
 #    return article_data
 
-def calculate_headline_count(article: Dict, all_articles: List[Dict]) -> int:
-    target_headline = article.get("title", "").strip().lower()
-    if not target_headline:
-        return 0
-    count = sum(1 for a in all_articles if a.get("title", "").strip().lower() == target_headline)
-    return count
+
+# Translate non-English articles to English; languages are detected locally with
+# cld3, so only non-English text goes over the network
+ENABLE_TRANSLATION = os.environ.get("ENABLE_TRANSLATION", "").lower() in ("1", "true", "yes")
+
+# Google Translate's per-request character limit, and a separator unlikely to
+# appear in (or be altered by translating) real text
+TRANSLATE_BATCH_CHARS = 5000
+_TRANSLATE_SEPARATOR = "\n\u241e\n"
+
+
+def _translate_batch(texts: List[str]) -> List[str]:
+    translator = get_translator()
+    joined = translator.translate(_TRANSLATE_SEPARATOR.join(texts), dest="en").text
+    parts = joined.split(_TRANSLATE_SEPARATOR.strip())
+    if len(parts) == len(texts):
+        return [part.strip() for part in parts]
+    # The separator didn't survive translation; fall back to one text per request
+    return [translator.translate(text, dest="en").text for text in texts]
+
+
+def translate_articles(articles: List[Dict]) -> None:
+    """
+    Translates the titles and content of non-English articles to English in
+    place, packing texts into as few translation requests as the limit allows.
+
+    Parameters:
+    - articles (List[Dict]): The articles to translate; updated in place.
+    """
+    import cld3
+
+    fields = []
+    for article in articles:
+        language = cld3.get_language(f"{article['title']} {article['content'][:500]}")
+        if language and language.is_reliable and language.language != "en":
+            fields.extend((article, key) for key in ("title", "content"))
+    if not fields:
+        return
+
+    # Pack texts into batches under the request limit; longer texts are cut to it
+    batches, batch, size = [], [], 0
+    for article, key in fields:
+        length = min(len(article[key]), TRANSLATE_BATCH_CHARS)
+        if batch and size + length + len(_TRANSLATE_SEPARATOR) > TRANSLATE_BATCH_CHARS:
+            batches.append(batch)
+            batch, size = [], 0
+        batch.append((article, key))
+        size += length + len(_TRANSLATE_SEPARATOR)
+    batches.append(batch)
+
+    logging.info(f"Translating {len(fields) // 2} articles in {len(batches)} requests")
+    for batch in batches:
+        try:
+            texts = [article[key][:TRANSLATE_BATCH_CHARS] for article, key in batch]
+            for (article, key), text in zip(batch, _translate_batch(texts)):
+                article[key] = text
+        except Exception as e:
+            logging.error(f"Translation error: {e}")
+
+    for article in articles:
+        article["_title_norm"] = article["title"].strip().lower()
+
 
 def calculate_priority_score(article: Dict, all_articles: List[Dict]) -> float:
-    sentiment_score, impact_score, action_score = calculate_scores_for_headline(article.get("title", ""))
+    # The title was lowercased once at ingest; reuse it for keyword matching
+    sentiment_score, impact_score, action_score = calculate_scores_for_headline(
+        article["title"], article["_title_norm"]
+    )
     
     # Adjust the weights as needed
     priority_score = 0.4 * sentiment_score + 0.3 * impact_score + 0.3 * action_score
     return priority_score
 
 
-def process_feeds(rss_feeds: List[str]) -> List[Dict]:
-    # Run the asynchronous feed fetching and processing
-    loop = asyncio.get_event_loop()
-    feed_contents = loop.run_until_complete(fetch_all_feeds(rss_feeds))
-    articles_content = []
-
-    for feed_content, feed_url in tqdm(
-        zip(feed_contents, rss_feeds), total=len(rss_feeds), desc="Processing feeds"
-    ):
-        if feed_content:
-            feed = feedparser.parse(feed_content)
-            if "entries" in feed and len(feed.entries) > 0:
-                for entry in feed.entries:
-                    article_data = process_article(entry, feed_url)
-                    if article_data:
-                        articles_content.append(article_data)
-            else:
-                logging.warning(f"No entries found in feed: {feed_url}")
+async def process_feeds_async(rss_feeds: List[str]) -> List[Dict]:
+    """
+    Fetches and parses feeds concurrently, handling each feed as soon as its
+    body arrives so only a few raw feed bodies are held in memory at once.
+
+    Parameters:
+    - rss_feeds (List[str]): The feed URLs to process.
+
+    Returns:
+    - List[Dict]: The articles extracted from all feeds.
+    """
+    loop = asyncio.get_running_loop()
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_FEEDS)
+    # Each feed's articles, by the feed's position in rss_feeds, so the output
+    # order doesn't depend on which download finished first
+    articles_by_feed = []
+
+    # feedparser is pure Python and CPU-bound, so parse in worker processes
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as pool:
+        async with feed_session() as session:
+
+            async def fetch_and_parse(feed_index, feed_url):
+                async with semaphore:
+                    feed_content = await fetch_feed(session, feed_url)
+                if not feed_content:
+                    return feed_index, None, feed_url
+                try:
+                    feed = await loop.run_in_executor(pool, parse_feed, feed_content)
+                except Exception as e:
+                    logging.error(f"Error parsing feed {feed_url}: {e}")
+                    return feed_index, None, feed_url
+                return feed_index, feed, feed_url
+
+            tasks = [
+                asyncio.create_task(fetch_and_parse(feed_index, feed_url))
+                for feed_index, feed_url in enumerate(rss_feeds)
+            ]
+            for task in tqdm.as_completed(tasks, total=len(tasks), desc="Processing feeds"):
+                try:
+                    feed_index, feed, feed_url = await task
+                except Exception as e:
+                    logging.error(f"Error processing feed: {e}")
+                    continue
+                if feed is None:
+                    continue
+                if "entries" in feed and len(feed.entries) > 0:
+                    feed_articles = []
+                    for entry in feed.entries:
+                        article_data = build_entry(entry, feed_url)
+                        if article_data:
+                            feed_articles.append(article_data)
+                    articles_by_feed.append((feed_index, feed_articles))
+                else:
+                    logging.warning(f"No entries found in feed: {feed_url}")
+
+            articles_by_feed.sort(key=itemgetter(0))
+            articles_content = [
+                article for _, feed_articles in articles_by_feed for article in feed_articles
+            ]
+
+            missing = [article for article in articles_content if not article["content"].strip()]
+            if missing and ENABLE_FULL_TEXT:
+                await fill_missing_content(session, missing)
+
+    # Drop articles that still have no content
+    articles_content = [article for article in articles_content if article["content"].strip()]
+
+    if ENABLE_TRANSLATION:
+        if HAS_CLD3:
+            # googletrans is synchronous; keep its requests off the event loop
+            await asyncio.to_thread(translate_articles, articles_content)
+        else:
+            logging.warning("ENABLE_TRANSLATION is set but pycld3 is not installed; skipping")
 
     logging.info(
         f"Processed {len(articles_content)} articles from {len(rss_feeds)} feeds"
@@ -646,12 +960,25 @@ def process_feeds(rss_feeds: List[str]) -> List[Dict]:
     return articles_content
 
 
+def process_feeds(rss_feeds: List[str]) -> List[Dict]:
+    # Run the asynchronous feed fetching and processing, on uvloop's faster
+    # libuv-based event loop when it is installed
+    if HAS_UVLOOP:
+        import uvloop
+
+        return uvloop.run(process_feeds_async(rss_feeds))
+    return asyncio.run(process_feeds_async(rss_feeds))
+
+
+# Resolved once; tz.gettz reads the zoneinfo database on each call
+CENTRAL_TZ = tz.gettz("America/Chicago")
+
 # Define common time zone abbreviations and their mappings
 tzinfos = {
     "EST": tz.gettz("America/New_York"),
     "EDT": tz.gettz("America/New_York"),
-    "CST": tz.gettz("America/Chicago"),
-    "CDT": tz.gettz("America/Chicago"),
+    "CST": CENTRAL_TZ,
+    "CDT": CENTRAL_TZ,
     "MST": tz.gettz("America/Denver"),
     "MDT": tz.gettz("America/Denver"),
     "PST": tz.gettz("America/Los_Angeles"),
@@ -664,9 +991,12 @@ tzinfos = {
 }
 
 
+_HOUR_24_RE = re.compile(r"24:(\d{2}):(\d{2})")
+
+
 def fix_invalid_time(date_str):
     # Match times with hour '24'
-    match = re.search(r"24:(\d{2}):(\d{2})", date_str)
+    match = _HOUR_24_RE.search(date_str)
     if match:
         # Replace '24' with '00'
         fixed_time = "00:{}:{}".format(match.group(1), match.group(2))
@@ -681,6 +1011,46 @@ def fix_invalid_time(date_str):
     return date_str, increment_day
 
 
+# RFC 822 and RFC 3339 layouts that nearly all feeds emit; %z also accepts "Z"
+_FAST_DATE_FORMATS = [
+    "%a, %d %b %Y %H:%M:%S %z",
+    "%Y-%m-%dT%H:%M:%S%z",
+]
+
+# strptime's %Z leaves the result naive, so spell UTC zone names as an offset
+_UTC_SUFFIX_RE = re.compile(r" (?:GMT|UTC|UT)$")
+
+
+@lru_cache(maxsize=4096)
+def fast_parse_date(date_str: str) -> datetime:
+    """
+    Parses a feed date, trying ISO 8601 and the common strptime layouts before
+    falling back to the much slower fuzzy dateutil parser.
+
+    Parameters:
+    - date_str (str): The date string from the feed.
+
+    Returns:
+    - datetime: The parsed date.
+    """
+    date_str = date_str.strip()
+    try:
+        return datetime.fromisoformat(date_str)
+    except ValueError:
+        pass
+    offset_str = _UTC_SUFFIX_RE.sub(" +0000", date_str)
+    for fmt in _FAST_DATE_FORMATS:
+        try:
+            return datetime.strptime(offset_str, fmt)
+        except ValueError:
+            continue
+    return date_parser.parse(date_str, tzinfos=tzinfos, fuzzy=True)
+
+
+# Below this many titles, forking spaCy workers costs more than it saves
+PARALLEL_NER_MIN_TITLES = 2000
+
+
 def filter_and_preprocess_articles(articles_content: List[Dict]) -> List[Dict]:
     """
     Filters articles within a 7-day window and preprocesses their content.
@@ -693,11 +1063,18 @@ def filter_and_preprocess_articles(articles_content: List[Dict]) -> List[Dict]:
     """
     logging.info("Filtering articles by date and preprocessing...")
     filtered_articles = []
-    today = datetime.now(tz.gettz("America/Chicago")).date()
+    today = datetime.now(CENTRAL_TZ).date()
     seven_days_ago = today - timedelta(days=6)
-    future_allowed = today + timedelta(days=1)
+    one_day = timedelta(days=1)
+    future_allowed = today + one_day
+
+    # Count identical (normalized) titles across all articles in a single pass
+    title_counts = Counter(article["_title_norm"] for article in articles_content)
+    title_counts.pop("", None)
 
     for article in tqdm(articles_content, desc="Preprocessing articles"):
+        # Read each field once; the loop runs over every fetched article
+        title = article["title"]
         publish_date = article.get("publish_date")
         publish_datetime = today  # Default to today
 
@@ -705,22 +1082,20 @@ def filter_and_preprocess_articles(articles_content: List[Dict]) -> List[Dict]:
             # Fix invalid times
             fixed_publish_date, increment_day = fix_invalid_time(publish_date)
             try:
-                # Try parsing the date using dateutil.parser with tzinfos
-                parsed_date = date_parser.parse(
-                    fixed_publish_date, tzinfos=tzinfos, fuzzy=True
-                )
+                # Try the fast formats first, then dateutil.parser with tzinfos
+                parsed_date = fast_parse_date(fixed_publish_date)
                 if increment_day:
-                    parsed_date += timedelta(days=1)
+                    parsed_date += one_day
                 publish_datetime = parsed_date.date()
             except (ValueError, TypeError) as e:
                 logging.warning(
-                    f"Unrecognized date format for article '{article['title']}': {publish_date}. Assigning today's date."
+                    f"Unrecognized date format for article '{title}': {publish_date}. Assigning today's date."
                 )
                 publish_datetime = today  # Assign today's date
 
         else:
             logging.warning(
-                f"No publish date for article '{article['title']}'. Assigning today's date."
+                f"No publish date for article '{title}'. Assigning today's date."
             )
             publish_datetime = today  # Assign today's date
 
@@ -728,42 +1103,54 @@ def filter_and_preprocess_articles(articles_content: List[Dict]) -> List[Dict]:
         article["publish_datetime"] = publish_datetime
 
         # Calculate 'headline_count' and 'priority_score'
-        article["headline_count"] = calculate_headline_count(article, articles_content)
+        article["headline_count"] = title_counts.get(article["_title_norm"], 0)
         article["priority_score"] = calculate_priority_score(article, articles_content)
 
         # Check if the article falls within the desired date range
         if seven_days_ago <= publish_datetime <= future_allowed:
             article["preprocessed_content"] = preprocess_article_content(article["content"])
-            article["entities"] = extract_entities(article["title"])
-            if article["title"] and len(article["title"].split()) >= 4:
+            if title and len(title.split()) >= 4:
                 # Only add articles with non-empty title and at least 4 words
                 filtered_articles.append(article)
             else:
-                logging.info(f"Skipping article with short title: '{article['title']}'")
+                logging.info(f"Skipping article with short title: '{title}'")
         else:
             logging.info(
-                f"Skipping article outside the 7-day window: '{article['title']}' (Date: {publish_datetime})"
+                f"Skipping article outside the 7-day window: '{title}' (Date: {publish_datetime})"
             )
 
+    # Run NER over all kept titles in one batched spaCy pass, sharded across
+    # worker processes when there are enough titles to repay starting them
+    titles = [article["title"] for article in filtered_articles]
+    n_process = (os.cpu_count() or 1) if len(titles) >= PARALLEL_NER_MIN_TITLES else 1
+    entities = extract_entities_batch(titles, n_process=n_process)
+    for article, article_entities in zip(filtered_articles, entities):
+        article["entities"] = article_entities
+
     logging.info(f"Filtered and preprocessed {len(filtered_articles)} articles")
     return filtered_articles
 
 
 
+# Kept for API compatibility; the pipeline no longer calls it, since
+# cluster_articles clusters on title embeddings instead
+@HAS_SKLEARN.require_in_call("calculate_similarity")
 def calculate_similarity(article1, article2):
     # Title similarity using fuzzy matching
-    title_similarity = fuzz.token_set_ratio(article1["title"], article2["title"]) / 100
+    title_similarity = fuzz.token_set_ratio(
+        article1["title"], article2["title"], processor=fuzz_utils.default_process
+    ) / 100
 
     # Title similarity using TF-IDF and cosine similarity
     if article1["title"] and article2["title"]:
         try:
             # Use bigrams and ignore common stopwords with TF-IDF
-            tfidf = TfidfVectorizer(
+            tfidf = sklearn_text.TfidfVectorizer(
                 ngram_range=(1, 2), stop_words="english"
             ).fit_transform([article1["title"], article2["title"]])
 
-            # Calculate cosine similarity between the two titles
-            title_similarity2 = cosine_similarity(tfidf[0], tfidf[1])[0][0]
+            # Rows are L2-normalized, so their dot product is the cosine similarity
+            title_similarity2 = tfidf[0].multiply(tfidf[1]).sum()
 
             # Only consider similarity scores above a set threshold 0-1
             if title_similarity2 < 0.85:
@@ -872,672 +1259,1121 @@ def calculate_similarity(article1, article2):
 #     return clustered_articles
 
 
-# New clustering function using Hugging Face Sentence Transformers and DBSCAN
-def cluster_articles(filtered_articles):
-    logging.info(
-        "Clustering similar articles using Sentence Transformers and DBSCAN..."
+# Titles per forward pass when embedding. Unset, it defaults to 128 on CPU and
+# 256 on a GPU; past the point where the device is saturated, bigger batches
+# only add padding
+EMBED_BATCH_SIZE = int(os.environ.get("EMBED_BATCH_SIZE", 0)) or None
+
+# CPU threads PyTorch uses when encoding titles
+EMBED_THREADS = int(os.environ.get("EMBED_THREADS", 0)) or os.cpu_count() or 1
+
+# Longest title, in tokens, passed to the embedding model; longer ones are truncated
+EMBED_MAX_SEQ_LENGTH = 64
+
+# Directory for on-disk caches that persist between runs
+CACHE_DIR = os.environ.get("MERIDIAN_CACHE_DIR", os.path.expanduser("~/.cache/meridian"))
+
+
+def normalize_rows(matrix):
+    """
+    L2-normalizes the rows of a float matrix in place. Row norms come from
+    einsum, which doesn't materialize the squared matrix the way
+    np.linalg.norm(axis=1) does, so the data is read once for the norms and
+    once for the scaling. Zero rows are left as zeros.
+
+    Parameters:
+    - matrix (np.ndarray): A 2-D floating-point array, modified in place.
+
+    Returns:
+    - np.ndarray: The same array.
+    """
+    norms = np.sqrt(np.einsum("ij,ij->i", matrix, matrix))
+    norms[norms == 0] = 1
+    matrix /= norms[:, None]
+    return matrix
+
+
+class OnnxEncoder:
+    """
+    Stand-in for SentenceTransformer.encode on CPU hosts, backed by an int8
+    dynamically quantized ONNX Runtime export of the model. The export is built
+    once and kept under the cache directory.
+
+    Mirrors the sentence-transformers pipeline for the MiniLM models: mean
+    pooling over the attention mask followed by L2 normalization.
+    """
+
+    def __init__(self, model_name: str, cache_dir: str = CACHE_DIR):
+        from optimum.onnxruntime import ORTModelForFeatureExtraction, ORTQuantizer
+        from optimum.onnxruntime.configuration import AutoQuantizationConfig
+
+        hub_name = f"sentence-transformers/{model_name}"
+        export_dir = os.path.join(cache_dir, f"{model_name}-onnx-int8")
+        if not os.path.exists(os.path.join(export_dir, "model_quantized.onnx")):
+            logging.info(f"Exporting {model_name} to ONNX in {export_dir}")
+            model = ORTModelForFeatureExtraction.from_pretrained(hub_name, export=True)
+            model.save_pretrained(export_dir)
+            transformers.AutoTokenizer.from_pretrained(hub_name).save_pretrained(export_dir)
+            ORTQuantizer.from_pretrained(model).quantize(
+                save_dir=export_dir,
+                quantization_config=AutoQuantizationConfig.avx2(is_static=False),
+            )
+
+        self.model = ORTModelForFeatureExtraction.from_pretrained(
+            export_dir, file_name="model_quantized.onnx"
+        )
+        self.tokenizer = transformers.AutoTokenizer.from_pretrained(export_dir)
+        self.max_seq_length = EMBED_MAX_SEQ_LENGTH
+
+    def encode(self, sentences: List[str], batch_size: int = 32, **kwargs):
+        batches = []
+        for start in range(0, len(sentences), batch_size):
+            inputs = self.tokenizer(
+                sentences[start:start + batch_size],
+                padding=True,
+                truncation=True,
+                max_length=self.max_seq_length,
+                return_tensors="np",
+            )
+            token_embeddings = self.model(**inputs).last_hidden_state
+            mask = inputs["attention_mask"][..., None].astype(np.float32)
+            pooled = (token_embeddings * mask).sum(axis=1) / np.clip(mask.sum(axis=1), 1e-9, None)
+            batches.append(normalize_rows(pooled))
+        return np.concatenate(batches)
+
+
+class EmbeddingCache:
+    """
+    On-disk cache of title embeddings, keyed by a hash of the normalized title,
+    so titles seen in earlier runs (or repeated across feeds) are only encoded once.
+
+    Vectors live in a SQLite table mapping a 64-bit title hash to the vector's
+    float16 bytes. Half precision is ample for cosine-threshold clustering and
+    halves the cache's size.
+    """
+
+    # Stay under SQLite's limit on bound parameters per statement
+    QUERY_CHUNK = 900
+
+    def __init__(self, model_name: str, cache_dir: str = CACHE_DIR):
+        self.path = os.path.join(cache_dir, f"embeddings-{model_name}.sqlite")
+        self.conn = None
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            self.conn = sqlite3.connect(self.path)
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache (hash INTEGER PRIMARY KEY, vec BLOB)"
+            )
+        except (OSError, sqlite3.Error) as e:
+            logging.warning(f"Embedding cache unavailable, encoding all titles: {e}")
+            self.conn = None
+
+    @staticmethod
+    def key(title: str) -> int:
+        # Case and runs of whitespace don't change what the (uncased) model sees,
+        # so syndicated copies differing only in those share one encode
+        normalized = " ".join(title.lower().split()).encode("utf-8")
+        # Signed, to fit SQLite's 64-bit INTEGER PRIMARY KEY
+        digest = hashlib.blake2b(normalized, digest_size=8).digest()
+        return int.from_bytes(digest, "little", signed=True)
+
+    def lookup(self, keys) -> Dict[int, bytes]:
+        if self.conn is None:
+            return {}
+        keys = list(keys)
+        found = {}
+        for start in range(0, len(keys), self.QUERY_CHUNK):
+            chunk = keys[start:start + self.QUERY_CHUNK]
+            rows = self.conn.execute(
+                f"SELECT hash, vec FROM cache WHERE hash IN ({','.join('?' * len(chunk))})",
+                chunk,
+            )
+            found.update(rows)
+        return found
+
+    def get_or_compute(self, titles: List[str], encoder):
+        """
+        Returns one embedding row per title, calling `encoder` (a function from a
+        list of titles to an embedding matrix) only for titles not yet cached.
+        """
+        keys = [self.key(title) for title in titles]
+        found = {
+            key: np.frombuffer(vec, dtype=np.float16)
+            for key, vec in self.lookup(set(keys)).items()
+        }
+
+        missing = {}
+        for key, title in zip(keys, titles):
+            if key not in found and key not in missing:
+                missing[key] = title
+
+        if missing:
+            logging.info(f"Embedding {len(missing)} new titles ({len(titles) - len(missing)} cached)")
+            new_vectors = np.asarray(encoder(list(missing.values())), dtype=np.float16)
+            found.update(zip(missing, new_vectors))
+            self.store(zip(missing, new_vectors))
+
+        return np.stack([found[key] for key in keys])
+
+    def store(self, items):
+        if self.conn is None:
+            return
+        try:
+            with self.conn:
+                self.conn.executemany(
+                    "INSERT OR REPLACE INTO cache (hash, vec) VALUES (?, ?)",
+                    [(key, vector.tobytes()) for key, vector in items],
+                )
+        except sqlite3.Error as e:
+            logging.warning(f"Could not write embedding cache: {e}")
+
+
+@lru_cache(maxsize=None)
+def get_embedding_cache(model_name: str) -> EmbeddingCache:
+    # One open cache connection per model for the life of the process
+    return EmbeddingCache(model_name)
+
+
+def embed_titles(model, titles: List[str], batch_size: int = EMBED_BATCH_SIZE):
+    """
+    Encodes all titles in one call, sorted by length so each batch pads to a
+    similar sequence length, and returns the embeddings in the original order.
+
+    Parameters:
+    - model: A loaded SentenceTransformer.
+    - titles (List[str]): The titles to embed.
+    - batch_size (int, optional): Titles per forward pass; defaults by device.
+
+    Returns:
+    - np.ndarray: One L2-normalized embedding row per title.
+    """
+    if batch_size is None:
+        batch_size = 128 if embedding_device() == "cpu" else 256
+    order = np.argsort([len(title) for title in titles], kind="stable")
+    embeddings = model.encode(
+        [titles[i] for i in order],
+        batch_size=batch_size,
+        convert_to_numpy=True,
+        normalize_embeddings=True,
+        show_progress_bar=False,
     )
-    num_articles = len(filtered_articles)
+    result = np.empty_like(embeddings)
+    result[order] = embeddings
+    return result
 
-    if num_articles == 0:
-        logging.error("No articles available for clustering.")
-        return defaultdict(list)
 
-    # Extract article titles
-    texts = [article["title"] for article in filtered_articles]
+# Rows of the similarity matrix computed per matrix product, bounding memory to
+# SIMILARITY_BLOCK_SIZE x N floats however many articles there are
+SIMILARITY_BLOCK_SIZE = 2048
 
-    # Load the pre-trained Sentence Transformer model
-    model_name = "all-MiniLM-L6-v2"  
-    model = SentenceTransformer(model_name)
+# From this many titles on, and with hnswlib installed, edges come from an
+# approximate HNSW neighbour search instead of exact matrix products, so time
+# grows as N log N rather than N^2. Each title is linked to at most
+# ANN_NEIGHBOURS others, which is plenty to keep a cluster connected
+ANN_MIN_ROWS = 50_000
+ANN_NEIGHBOURS = 32
 
-    # Generate embeddings for the titles
-    embeddings = model.encode(texts, show_progress_bar=True)
 
-    # Normalize embeddings
-    embeddings = embeddings / np.linalg.norm(embeddings, axis=1, keepdims=True)
+def ann_similarity_edges(embeddings, threshold: float, query_rows):
+    """
+    Approximate similarity_edges using an HNSW index over the embeddings: each
+    query row is linked to those of its nearest neighbours at or above
+    `threshold`, and may miss a few true edges.
+    """
+    import hnswlib
 
-    # Use DBSCAN for clustering, adjust as needed
-    clustering_model = DBSCAN(eps=0.25, min_samples=2, metric="cosine")
-    clustering_model.fit(embeddings)
+    num_rows, dim = embeddings.shape
+    index = hnswlib.Index(space="ip", dim=dim)
+    index.init_index(max_elements=num_rows, ef_construction=100, M=16)
+    index.add_items(embeddings, np.arange(num_rows), num_threads=-1)
+    k = min(ANN_NEIGHBOURS, num_rows)
+    index.set_ef(max(2 * k, 64))
 
-    labels = clustering_model.labels_
+    # The "ip" space reports 1 - inner product, i.e. cosine distance here
+    neighbours, distances = index.knn_query(embeddings[query_rows], k=k, num_threads=-1)
+    matches = distances <= 1.0 - threshold
+    rows = np.broadcast_to(query_rows[:, None], neighbours.shape)[matches]
+    return rows.astype(np.intp), neighbours[matches].astype(np.intp)
 
-    # Organize articles into clusters
-    clustered_articles = defaultdict(list)
-    for idx, label in enumerate(labels):
-        if label == -1:
-            # Noise point, assign to its own cluster
-            clustered_articles[f"noise_{idx}"].append(filtered_articles[idx])
-        else:
-            clustered_articles[label].append(filtered_articles[idx])
 
-    logging.info(f"Clustering complete. Found {len(clustered_articles)} clusters")
-    return clustered_articles
+def similarity_edges(
+    embeddings, threshold: float, block_size: int = SIMILARITY_BLOCK_SIZE, query_rows=None
+):
+    """
+    Finds the pairs of unit vectors whose cosine similarity is at least
+    `threshold`, comparing the query rows against every row. From ANN_MIN_ROWS
+    rows on, the pairs come from ann_similarity_edges if hnswlib is installed.
 
+    Parameters:
+    - embeddings (np.ndarray): L2-normalized vectors, one per row.
+    - threshold (float): Minimum cosine similarity for an edge.
+    - block_size (int): Rows per matrix product.
+    - query_rows (np.ndarray): Row indices to compare; all rows if None.
 
-def is_valid_headline(title):
-    # Avoid headlines that are likely advertisements, video streams, or news bulletins
-    invalid_patterns = [
-        r"(?i)\bnews bulletin\b",
-        r"(?i)\bvideo:",
-        r"(?i)\bsports\b",
-        r"(?i)\watch on tv\b",
-        r"(?i)\bonline for free\b",
-        r"(?i)\bhow to watch\b",
-        r"(?i)\bathlete\b",
-        r"(?i)\bhow to get\b",
-        r"(?i)\bhints, answers\b",
-        r"(?i)\bcelebrity\b",
-        r"(?i)\bholiday\b",
-        r"(?i)\bhow to\b",
-        r"(?i)\bwatch live:",
-        r"(?i)\broundup:",
-        r"(?i)\bhurdle hints\b",
-        r"(?i)\bstreaming",
-        r"(?i)\bbest restaurants\b",
-        r"(?i)\bnow available\b",
-        r"(?i)\bin free\b",
-        r"(?i)\bcustomer\b",
-        r"(?i)\bvideo...\b",
-        r"(?i)\bmensware",
-        r"(?i)\bfashion",
-        r"(?i)\bpromo",
-        r"(?i)\btouchscreen",
-        r"(?i)\bblogging",
-        r"(?i)\btested and reviewed\b",
-        r"(?i)\bthe best\b",
-        r"(?i)\bbest movies\b",
-        r"(?i)\blower blood pressure\b",
-        r"(?i)\bshare the 1\b",
-        r"(?i)\bshare the one\b",
-        r"(?i)\bdegree",
-        r"(?i)\bmentorship",
-        r"(?i)\bhelp\b",
-        r"(?i)\blowest price\b",
-        r"(?i)\baseball\b",
-        r"(?i)\bfootball\b",
-        r"(?i)\basketball\b",
-        r"(?i)\depository\b",
-        r"(?i)\dividend\b",
-        r"(?i)\sneaker\b",
-        r"(?i)\bstar-studded\b",
-        r"(?i)\bwordle\b",
-        r"(?i)\bget the new\b",
-        r"(?i)\bpromo code\b",
-        r"(?i)\breview:\b",
-        r"(?i)\binnovation",
-        r"(?i)\bstormcast",
-        r"(?i)\bhas anyone ever\b",
-        r"(?i)\btoday:",
-        r"(?i)\bawesome",
-        r"(?i)\btop picks\b",
-        r"(?i)\bbest phones\b",
-        r"(?i)\bhoroscope:",
-        r"(?i)\bapple launches\b",
-        r"(?i)\bquick take:\b",
-        r"(?i)\banalysis",
-        r"(?i)\bcoupon",
-        r"(?i)\bsavings",
-        r"(?i)\bwebinar",
-        r"(?i)\bgrammy",
-        r"(?i)\bvideo",
-        r"(?i)\bReview:",
-        r"(?i)\bmorning read\b",
-        r"(?i)\bmy notes\b",
-        r"(?i)\bdownload:\b",
-        r"(?i)\bcheap",
-        r"(?i)\bmac",
-        r"(?i)\bearnings call:\b",
-        r"(?i)\best things\b",
-        r"(?i)\btoday:",
-        r"(?i)\bshopping season\b",
-        r"(?i)\bwhat to expect\b",
-        r"(?i)\bhints and answers\b",
-        r"(?i)\bprime day\b",
-        r"(?i)\bbrands\b",
-        r"(?i)\bfor free\b",
-        r"(?i)\bnominated",
-        r"(?i)\bwatch:",
-        r"(?i)\bclosing bell\b",
-        r"(?i)\bdaily discussion\b",
-        r"(?i)\bsigns of ageing\b",
-        r"(?i)\bvs\.\b",
-        r"(?i)\bv\.\b",
-        r"(?i)\bvs\b",
-        r"(?i)\bv\b",
-        r"(?i)\bleague\b",
-        r"(?i)\btrophy\b",
-        r"(?i)\bmanager\b",
-        r"(?i)\bwhat to know about\b",
-        r"(?i)\bblack friday\b",
-        r"(?i)\bcrossword\b",
-        r"(?i)\blivestream\b",
-        r"(?i)\bbusinessweek:",
-        r"(?i)\bearnings snapshot:",
-        r"(?i)\bearnings preview\b",
-        r"(?i)\bbloomberg surveillance\b",
-        r"(?i)\bbloomberg open interest\b",
-        r"(?i)\bperforming badly\b",
-        r"(?i)\bopinion:",
-        r"(?i)\bphotos:",
-        r"(?i)\blive updates\b",
-        r"(?i)\blive thread\b",
-        r"(?i)\badvertisement\b",
-        r"(?i)\bsponsored content\b",
-    ]
-    return not any(re.search(pattern, title) for pattern in invalid_patterns)
+    Returns:
+    - tuple: Arrays (rows, cols) of the matching pairs, self-pairs included.
+    """
+    if query_rows is None:
+        query_rows = np.arange(len(embeddings))
 
+    if len(embeddings) >= ANN_MIN_ROWS and len(query_rows) and HAS_HNSWLIB:
+        return ann_similarity_edges(embeddings, threshold, query_rows)
+
+    rows, cols = [np.empty(0, dtype=np.intp)], [np.empty(0, dtype=np.intp)]
+    for start in range(0, len(query_rows), block_size):
+        # One BLAS matrix product per block of rows
+        block = query_rows[start:start + block_size]
+        similarities = embeddings[block] @ embeddings.T
+        block_rows, block_cols = np.nonzero(similarities >= threshold)
+        rows.append(block[block_rows])
+        cols.append(block_cols)
+    return np.concatenate(rows), np.concatenate(cols)
 
-def prioritize_headline(title, content):
-    priority_keywords = [
-        # BUSINESS
-        "business",
-        "venture capital",
-        "private equity",
-        "seed funding",
-        "series-a",
-        "series a",
-        "series-b",
-        "series b",
-        "tax",
-        "taxes",
-        "LLC",
-        "saas",
-        "b2b",
-        "ecommerce",
-        # ECONOMIC
-        "economy",
-        "economic",
-        "economies",
-        "central bank",
-        "rate cuts",
-        "housing",
-        "mortgage rates",
-        "fomc",
-        "monetary",
-        "financial",
-        "business",
-        "federal reserve",
-        "inflation",
-        "gdp",
-        "jobs",
-        "strike",
-        "markets",
-        "deal",
-        "layoff",
-        "layoffs",
-        "prices",
-        "corporate",
-        "enterprise",
-        "volatility",
-        "equities",
-        "securities",
-        "futures",
-        "crypto",
-        "bitcoin",
-        "ethereum",
-        "dogecoin",
-        "xrp",
-        "ripple",
-        "shiba",
-        "exchange",
-        "earnings",
-        "bankruptcy",
-        "bankrupt",
-        "acquire",
-        "acquisition",
-        # CLIMATE
-        "weather",
-        "weather pattern",
-        "climate",
-        "natural disaster",
-        "fema",
-        "hurricane",
-        "tropical storm",
-        "tropical development",
-        "storm brews",
-        "flooding",
-        "floods",
-        "volcanic",
-        "wildfire",
-        "tsunami",
-        "freak",
-        "torrential",
-        "flare",
-        "climate change",
-        "asteroid",
-        "pollution",
-        "earthquake",
-        "environment",
-        "freeze",
-        "frozen",
-        "cold snap",
-        "tornado",
-        "eclipse",
-        "air quality",
-        "smog",
-        # COMODITIES
-        "silicon",
-        "cobalt",
-        "graphite",
-        "gold",
-        "silver",
-        # CYBER
-        "hack",
-        "breach",
-        "cyber",
-        "leak",
-        "leaked",
-        "hackers",
-        "misinformation",
-        "compromise",
-        "back door",
-        "backfire",
-        "documents",
-        "secret",
-        "influenced",
-        # ENERGY
-        "energy",
-        "oil",
-        "renewable",
-        "solar",
-        "wind",
-        "turbine",
-        "reactors",
-        "petroleum",
-        "gasoline",
-        "gas prices",
-        "nuclear",
-        "thermonuclear",
-        "electric grid",
-        "power grid",
-        "blackout",
-        "blackouts",
-        "brownout",
-        "brownouts",
-        "without water",
-        "without power",
-        "without electricity",
-        # FINANCIAL MARKETS
-        "stock market",
-        "mag 7",
-        "magnificent 7",
-        "s&p",
-        "prices fall",
-        "prices soar",
-        "faang",
-        "index",
-        "plunge",
-        "dow",
-        "valuation",
-        "tesla",
-        "google",
-        "amd",
-        "nvidia",
-        "netflix",
-        "meta",
-        "amazon",
-        "apple",
-        "boeing",
-        "spacex",
-        "starlink",
-        "dell",
-        "twitter",
-        "gamestop",
-        "microsoft",
-        "intel",
-        "ibm",
-        "investors",
-        "stock",
-        "enterprise",
-        "executive",
-        # GOVERNMENT
-        "senate",
-        "congress",
-        "parliament",
-        "secretary",
-        "state",
-        "department of defense",
-        "dod",
-        "pentagon",
-        "secret service",
-        "nato",
-        "pentagon",
-        "cia",
-        "fbi",
-        "government",
-        "stimulus",
-        "mandate",
-        "ministry",
-        "minister",
-        "coalition",
-        "authorities",
-        # HEALTH
-        "health",
-        "pandemic",
-        "spreading rapidly",
-        "spreading across",
-        "outbreak",
-        "hot zone",
-        "panic",
-        "illness",
-        "virus",
-        "strain",
-        "vaccine",
-        "hospitals",
-        "medical centers",
-        "cdc",
-        # IMPACT
-        "major shift",
-        "sea change",
-        "major trend",
-        "amping up",
-        "once in a lifetime",
-        "vows to",
-        "catastrophy",
-        "disaster",
-        "destruction",
-        "unprecedented",
-        "declares",
-        "displaced",
-        "large scale",
-        "urges response",
-        "calls on",
-        "world record",
-        "world records",
-        "kills",
-        "dies",
-        "dies at",
-        "record",
-        "historic",
-        "faction",
-        "existential",
-        # INDUSTRY
-        "automotive",
-        "manufacturing",
-        "microchip",
-        "microprocessor",
-        "processor",
-        "travel",
-        "flight",
-        "airliner",
-        # SCIENCE
-        "science",
-        "archaeologists",
-        "biologists",
-        "scientists",
-        "habitable",
-        "mission",
-        "launches",
-        "quantum",
-        "once-in",
-        "mechanical",
-        "engineering",
-        "interstellar",
-        "discovers",
-        "element",
-        "uap",
-        "ufo",
-        "anomaly",
-        "cern",
-        "large hadron",
-        "metaphysics",
-        # TRADE
-        "trade",
-        "export",
-        "import",
-        "exports",
-        "imports",
-        "sanctions",
-        "seize",
-        "closing locations",
-        "trade war",
-        "impose tarrifs",
-        "port",
-        "union",
-        "accept bid",
-        "shortage",
-        "braces",
-        "tariffs",
-        "global trade",
-        "tarrif",
-        "manufacturing",
-        "supply chain",
-        "tsmc",
-        "shippers",
-        "shipping",
-        "route",
-        "distribution",
-        "transportation",
-        "workforce",
-        "forecast",
-        "free trade",
-        "restrictions",
-        # TECHNOLOGY
-        "technology",
-        "innovation",
-        "artifical intelligence",
-        "ai",
-        "machine learning",
-        "chatgpt",
-        "openai",
-        "anthropic",
-        "claude 3.5",
-        "decision intelligence",
-        "data mapping",
-        "autonomous",
-        "bleeding edge",
-        "next generation",
-        "revolutionary",
-        "visionary",
-        "data",
-        "engineering",
-        "software",
-        "saas",
-        "robot",
-        "robots",
-        "robotics",
-        "technology",
-        "satellite",
-        "comet",
-        "space",
-        "nasa",
-        "scientists",
-        "rocket",
-        "launch",
-        "spacecraft",
-        "expedition",
-        "pioneer",
-        "astrophysics",
-        "astronomy",
-        "radiation",
-        # PEOPLE
-        "warren buffet",
-        "musk",
-        "bill gates",
-        "tim cook",
-        "bezos",
-        "sam altman",
-        "powell",
-        "gensler",
-        "zelenky",
-        "zelenskiy",
-        "zelinskyy",
-        "putin",
-        "kim jung",
-        "xi",
-        "merkel",
-        "ken griffin",
-        "macron",
-        "trudeau",
-        "brian may",
-        # PEOPLE CATEGORIES
-        "boomers",
-        "gen-z",
-        "gen z",
-        "millenials",
-        # POLICY
-        "policy",
-        "supreme court",
-        "legistlation",
-        "committee",
-        "directive",
-        "legislature",
-        "laws",
-        "precedent",
-        # POLITICS
-        "government",
-        "political",
-        "pundit",
-        "election",
-        "leader",
-        "president",
-        "state",
-        "nation",
-        "global",
-        "regional",
-        "worldwide",
-        "presidency",
-        "prime minister",
-        "foreign minister",
-        "syndicate",
-        "speech",
-        "incumbent",
-        "constituent",
-        "border",
-        # POLITICS - US
-        "biden",
-        "harris",
-        "trump",
-        "vance",
-        "democracy",
-        "republican",
-        "democrat",
-        "liberal",
-        "gop",
-        "far-right",
-        "far-left",
-        # POLITICS - WORLD
-        "geopolitical",
-        "politics",
-        "campaign",
-        "world leaders",
-        "peace",
-        "international relations",
-        "diplomacy",
-        "historic",
-        "diplomatic",
-        "accord",
-        "international waters",
-        "international airspace",
-        "prince",
-        "king",
-        "queen",
-        "princess",
-        # REGULATION
-        "outlaw",
-        "censor",
-        "censored",
-        "censorship",
-        "regulation",
-        # REGIONAL
-        "hemisphere",
-        "united states",
-        "united kingdom",
-        "africa",
-        "israel",
-        "gaza",
-        "lebanon",
-        "iran",
-        "turkey",
-        "eu",
-        "europe",
-        "north korea",
-        "saudi",
-        "asia",
-        "middle east",
-        "russia",
-        "ukraine",
-        "china",
-        "india",
-        "taiwan",
-        "south america",
-        "mexico",
-        "north korea",
-        # UNREST
-        "revolution",
-        "protest",
-        "protestors",
-        "crisis",
-        "turmoil",
-        "looting",
-        # WAR & CONFLICT
-        "conflict",
-        "war",
-        "war against",
-        "war on",
-        "battleground",
-        "weapons",
-        "weapons material",
-        "intelligence agencies",
-        "intelligence agency",
-        "raid",
-        "radical",
-        "revolt",
-        "caliphate",
-        "insurgent",
-        "fugitive",
-        "intercepts",
-        "deploys",
-        "captured",
-        "destablizing",
-        "tensions",
-        "millitary action",
-        "independence",
-        "projectiles",
-        "elliminate",
-        "terrorist",
-        "faction",
-        "soldiers",
-        "troops",
-        "drills",
-        "front line",
-        "warplane",
-        "warship",
-        "shelling",
-        "bombing",
-        "air attack",
-        "expel",
-        "condemns",
-        "peacekeepers",
-        "pressure",
-        "asylum",
-        "migrant",
-        "migratory",
-        "attack",
-        "attacks",
-        "deadly",
-        "military",
-        "army",
-        "siege",
-        "embezzle",
-        "embezzling",
-        "coup",
-        "combat",
-        "fighting",
-        "infighting",
-        "hostage",
-        "negotiate",
-        "militia",
-        "anti-missile",
-        "relations",
-        "assassination",
-        "war crime",
-        "genocide",
-    ]
 
+def label_components(num_rows: int, rows, cols):
+    """
+    Labels the connected components of an undirected graph given by its edges.
+    Rows with no edge other than to themselves get -1.
+
+    Parameters:
+    - num_rows (int): Number of vertices.
+    - rows (np.ndarray): First vertex of each edge.
+    - cols (np.ndarray): Second vertex of each edge.
+
+    Returns:
+    - np.ndarray: One component label per vertex, -1 for isolated vertices.
+    """
+    graph = scipy_sparse.csr_matrix(
+        (np.ones(len(rows), dtype=np.int8), (rows, cols)), shape=(num_rows, num_rows)
+    )
+    _, labels = scipy_csgraph.connected_components(graph, directed=False)
+
+    # Rows matching only themselves are noise, as in DBSCAN
+    off_diagonal = rows != cols
+    neighbours = np.bincount(
+        np.concatenate([rows[off_diagonal], cols[off_diagonal]]), minlength=num_rows
+    )
+    labels[neighbours == 0] = -1
+    return labels
+
+
+def load_similarity_graph(path: str, threshold: float):
+    """
+    Loads the title keys and similarity edges saved by the previous run, or
+    returns None if there are none for this threshold.
+    """
+    try:
+        with np.load(path) as saved:
+            if float(saved["threshold"]) != threshold:
+                return None
+            return saved["keys"], saved["edges"]
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+def save_similarity_graph(path: str, threshold: float, keys, edges):
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Write to a temporary file first so a crash never leaves a partial graph
+        with open(f"{path}.tmp", "wb") as f:
+            np.savez(f, threshold=threshold, keys=keys, edges=edges)
+        os.replace(f"{path}.tmp", path)
+    except OSError as e:
+        logging.warning(f"Could not save similarity graph: {e}")
+
+
+def incremental_similarity_components(keys, embeddings, threshold: float, path: str):
+    """
+    Labels connected components of the graph linking unit vectors whose cosine
+    similarity is at least `threshold`. Vectors with no such neighbour get -1.
+
+    This is exactly DBSCAN with min_samples=2 and eps = 1 - threshold: every
+    point with one neighbour is a core point, so clusters are the components.
+
+    Edges found by the previous run, which compared every pair of its titles,
+    are reused; only titles new since then are compared against the rest:
+    O(new x N) instead of O(N^2).
+
+    Parameters:
+    - keys (List[int]): EmbeddingCache key of each row's title.
+    - embeddings (np.ndarray): L2-normalized vectors, one per row.
+    - threshold (float): Minimum cosine similarity for an edge.
+    - path (str): File holding the graph between runs.
+
+    Returns:
+    - np.ndarray: One cluster label per row, -1 for isolated rows.
+    """
+    if len(keys) == 0:
+        return np.empty(0, dtype=np.int32)
+
+    # Rows with the same key share one embedding, so the graph is built over
+    # distinct keys (np.unique sorts them, which the lookups below rely on)
+    unique_keys, first_rows, inverse, counts = np.unique(
+        np.asarray(keys, dtype=np.int64), return_index=True, return_inverse=True, return_counts=True
+    )
+    unique_embeddings = embeddings[first_rows]
+
+    previous = load_similarity_graph(path, threshold)
+    if previous is None:
+        previous_keys, previous_edges = np.empty(0, dtype=np.int64), np.empty((2, 0), dtype=np.int64)
+    else:
+        previous_keys, previous_edges = previous
+
+    # Edges among titles that were all in the previous run carry over as-is
+    kept = np.isin(previous_edges, unique_keys).all(axis=0)
+    kept_rows, kept_cols = np.searchsorted(unique_keys, previous_edges[:, kept])
+
+    # Titles new since then are compared against every title
+    new_rows = np.flatnonzero(~np.isin(unique_keys, previous_keys))
+    if len(previous_keys):
+        logging.info(f"Comparing {len(new_rows)} new of {len(unique_keys)} distinct titles")
+    new_rows, new_cols = similarity_edges(unique_embeddings, threshold, query_rows=new_rows)
+    off_diagonal = new_rows != new_cols
+    new_rows, new_cols = new_rows[off_diagonal], new_cols[off_diagonal]
+
+    rows = np.concatenate([kept_rows, new_rows])
+    cols = np.concatenate([kept_cols, new_cols])
+    save_similarity_graph(path, threshold, unique_keys, unique_keys[np.stack([rows, cols])])
+
+    labels = label_components(len(unique_keys), rows, cols)
+    # Repeated titles are each other's neighbours, so they are never noise
+    repeated_noise = np.flatnonzero((labels == -1) & (counts > 1))
+    labels[repeated_noise] = labels.max(initial=-1) + 1 + np.arange(len(repeated_noise))
+    return labels[inverse]
+
+
+# New clustering function using Hugging Face Sentence Transformers and
+# threshold-graph (DBSCAN-equivalent) clustering
+@HAS_SCIPY.require_in_call("cluster_articles")
+@HAS_SENTENCE_TRANSFORMERS.require_in_call("cluster_articles")
+def cluster_articles(filtered_articles):
+    logging.info(
+        "Clustering similar articles using Sentence Transformers..."
+    )
+    num_articles = len(filtered_articles)
+
+    if num_articles == 0:
+        logging.error("No articles available for clustering.")
+        return defaultdict(list)
+
+    # Extract article titles
+    texts = [article["title"] for article in filtered_articles]
+
+    # Generate embeddings for the titles, loading the Sentence Transformer model
+    # only if some titles are not in the embedding cache yet
+    model_name = "all-MiniLM-L6-v2"
+
+    def encode(titles):
+        return embed_titles(get_sbert(model_name), titles)
+
+    cache = get_embedding_cache(model_name)
+    embeddings = cache.get_or_compute(texts, encode)
+
+    # Normalize embeddings so cosine similarity is a plain dot product; they are
+    # cached as float16 but upcast here, since numpy has no half-precision BLAS
+    embeddings = normalize_rows(np.array(embeddings, dtype=np.float32))
+
+    # Link titles within cosine distance eps of each other and take the
+    # connected components as clusters; adjust eps as needed
+    eps = 0.25
+    labels = incremental_similarity_components(
+        [cache.key(text) for text in texts],
+        embeddings,
+        1.0 - eps,
+        os.path.join(CACHE_DIR, f"similarity-graph-{model_name}.npz"),
+    )
+
+    # Organize articles into clusters: a stable sort brings each label's indices
+    # together (in article order), then split at the label boundaries
+    order = np.argsort(labels, kind="stable")
+    sorted_labels = labels[order]
+    groups = np.split(order, np.flatnonzero(np.diff(sorted_labels)) + 1)
+
+    keyed_groups = []
+    for group in groups:
+        label = labels[group[0]]
+        if label == -1:
+            # Noise points, each assigned to its own cluster
+            keyed_groups.extend((f"noise_{idx}", [idx]) for idx in group)
+        else:
+            keyed_groups.append((int(label), group))
+
+    # Keep clusters in order of their first article, as before
+    keyed_groups.sort(key=lambda item: item[1][0])
+    clustered_articles = defaultdict(list)
+    for key, group in keyed_groups:
+        clustered_articles[key] = [filtered_articles[idx] for idx in group]
+
+    logging.info(f"Clustering complete. Found {len(clustered_articles)} clusters")
+    return clustered_articles
+
+
+# Avoid headlines that are likely advertisements, video streams, or news bulletins
+INVALID_HEADLINE_PATTERNS = [
+    r"(?i)\bnews bulletin\b",
+    r"(?i)\bvideo:",
+    r"(?i)\bsports\b",
+    r"(?i)\watch on tv\b",
+    r"(?i)\bonline for free\b",
+    r"(?i)\bhow to watch\b",
+    r"(?i)\bathlete\b",
+    r"(?i)\bhow to get\b",
+    r"(?i)\bhints, answers\b",
+    r"(?i)\bcelebrity\b",
+    r"(?i)\bholiday\b",
+    r"(?i)\bhow to\b",
+    r"(?i)\bwatch live:",
+    r"(?i)\broundup:",
+    r"(?i)\bhurdle hints\b",
+    r"(?i)\bstreaming",
+    r"(?i)\bbest restaurants\b",
+    r"(?i)\bnow available\b",
+    r"(?i)\bin free\b",
+    r"(?i)\bcustomer\b",
+    r"(?i)\bvideo...\b",
+    r"(?i)\bmensware",
+    r"(?i)\bfashion",
+    r"(?i)\bpromo",
+    r"(?i)\btouchscreen",
+    r"(?i)\bblogging",
+    r"(?i)\btested and reviewed\b",
+    r"(?i)\bthe best\b",
+    r"(?i)\bbest movies\b",
+    r"(?i)\blower blood pressure\b",
+    r"(?i)\bshare the 1\b",
+    r"(?i)\bshare the one\b",
+    r"(?i)\bdegree",
+    r"(?i)\bmentorship",
+    r"(?i)\bhelp\b",
+    r"(?i)\blowest price\b",
+    r"(?i)\baseball\b",
+    r"(?i)\bfootball\b",
+    r"(?i)\basketball\b",
+    r"(?i)\depository\b",
+    r"(?i)\dividend\b",
+    r"(?i)\sneaker\b",
+    r"(?i)\bstar-studded\b",
+    r"(?i)\bwordle\b",
+    r"(?i)\bget the new\b",
+    r"(?i)\bpromo code\b",
+    r"(?i)\breview:\b",
+    r"(?i)\binnovation",
+    r"(?i)\bstormcast",
+    r"(?i)\bhas anyone ever\b",
+    r"(?i)\btoday:",
+    r"(?i)\bawesome",
+    r"(?i)\btop picks\b",
+    r"(?i)\bbest phones\b",
+    r"(?i)\bhoroscope:",
+    r"(?i)\bapple launches\b",
+    r"(?i)\bquick take:\b",
+    r"(?i)\banalysis",
+    r"(?i)\bcoupon",
+    r"(?i)\bsavings",
+    r"(?i)\bwebinar",
+    r"(?i)\bgrammy",
+    r"(?i)\bvideo",
+    r"(?i)\bReview:",
+    r"(?i)\bmorning read\b",
+    r"(?i)\bmy notes\b",
+    r"(?i)\bdownload:\b",
+    r"(?i)\bcheap",
+    r"(?i)\bmac",
+    r"(?i)\bearnings call:\b",
+    r"(?i)\best things\b",
+    r"(?i)\btoday:",
+    r"(?i)\bshopping season\b",
+    r"(?i)\bwhat to expect\b",
+    r"(?i)\bhints and answers\b",
+    r"(?i)\bprime day\b",
+    r"(?i)\bbrands\b",
+    r"(?i)\bfor free\b",
+    r"(?i)\bnominated",
+    r"(?i)\bwatch:",
+    r"(?i)\bclosing bell\b",
+    r"(?i)\bdaily discussion\b",
+    r"(?i)\bsigns of ageing\b",
+    r"(?i)\bvs\.\b",
+    r"(?i)\bv\.\b",
+    r"(?i)\bvs\b",
+    r"(?i)\bv\b",
+    r"(?i)\bleague\b",
+    r"(?i)\btrophy\b",
+    r"(?i)\bmanager\b",
+    r"(?i)\bwhat to know about\b",
+    r"(?i)\bblack friday\b",
+    r"(?i)\bcrossword\b",
+    r"(?i)\blivestream\b",
+    r"(?i)\bbusinessweek:",
+    r"(?i)\bearnings snapshot:",
+    r"(?i)\bearnings preview\b",
+    r"(?i)\bbloomberg surveillance\b",
+    r"(?i)\bbloomberg open interest\b",
+    r"(?i)\bperforming badly\b",
+    r"(?i)\bopinion:",
+    r"(?i)\bphotos:",
+    r"(?i)\blive updates\b",
+    r"(?i)\blive thread\b",
+    r"(?i)\badvertisement\b",
+    r"(?i)\bsponsored content\b",
+]
+
+# All patterns in one case-insensitive alternation, so each title is scanned
+# once instead of once per pattern
+_INVALID_HEADLINE_RE = re.compile(
+    "|".join(f"(?:{pattern.removeprefix('(?i)')})" for pattern in INVALID_HEADLINE_PATTERNS),
+    re.IGNORECASE,
+)
+
+
+def is_valid_headline(title):
+    return _INVALID_HEADLINE_RE.search(title) is None
+
+
+# Keywords that raise a headline's priority, one point per keyword found
+PRIORITY_KEYWORDS = [
+    # BUSINESS
+    "business",
+    "venture capital",
+    "private equity",
+    "seed funding",
+    "series-a",
+    "series a",
+    "series-b",
+    "series b",
+    "tax",
+    "taxes",
+    "LLC",
+    "saas",
+    "b2b",
+    "ecommerce",
+    # ECONOMIC
+    "economy",
+    "economic",
+    "economies",
+    "central bank",
+    "rate cuts",
+    "housing",
+    "mortgage rates",
+    "fomc",
+    "monetary",
+    "financial",
+    "business",
+    "federal reserve",
+    "inflation",
+    "gdp",
+    "jobs",
+    "strike",
+    "markets",
+    "deal",
+    "layoff",
+    "layoffs",
+    "prices",
+    "corporate",
+    "enterprise",
+    "volatility",
+    "equities",
+    "securities",
+    "futures",
+    "crypto",
+    "bitcoin",
+    "ethereum",
+    "dogecoin",
+    "xrp",
+    "ripple",
+    "shiba",
+    "exchange",
+    "earnings",
+    "bankruptcy",
+    "bankrupt",
+    "acquire",
+    "acquisition",
+    # CLIMATE
+    "weather",
+    "weather pattern",
+    "climate",
+    "natural disaster",
+    "fema",
+    "hurricane",
+    "tropical storm",
+    "tropical development",
+    "storm brews",
+    "flooding",
+    "floods",
+    "volcanic",
+    "wildfire",
+    "tsunami",
+    "freak",
+    "torrential",
+    "flare",
+    "climate change",
+    "asteroid",
+    "pollution",
+    "earthquake",
+    "environment",
+    "freeze",
+    "frozen",
+    "cold snap",
+    "tornado",
+    "eclipse",
+    "air quality",
+    "smog",
+    # COMODITIES
+    "silicon",
+    "cobalt",
+    "graphite",
+    "gold",
+    "silver",
+    # CYBER
+    "hack",
+    "breach",
+    "cyber",
+    "leak",
+    "leaked",
+    "hackers",
+    "misinformation",
+    "compromise",
+    "back door",
+    "backfire",
+    "documents",
+    "secret",
+    "influenced",
+    # ENERGY
+    "energy",
+    "oil",
+    "renewable",
+    "solar",
+    "wind",
+    "turbine",
+    "reactors",
+    "petroleum",
+    "gasoline",
+    "gas prices",
+    "nuclear",
+    "thermonuclear",
+    "electric grid",
+    "power grid",
+    "blackout",
+    "blackouts",
+    "brownout",
+    "brownouts",
+    "without water",
+    "without power",
+    "without electricity",
+    # FINANCIAL MARKETS
+    "stock market",
+    "mag 7",
+    "magnificent 7",
+    "s&p",
+    "prices fall",
+    "prices soar",
+    "faang",
+    "index",
+    "plunge",
+    "dow",
+    "valuation",
+    "tesla",
+    "google",
+    "amd",
+    "nvidia",
+    "netflix",
+    "meta",
+    "amazon",
+    "apple",
+    "boeing",
+    "spacex",
+    "starlink",
+    "dell",
+    "twitter",
+    "gamestop",
+    "microsoft",
+    "intel",
+    "ibm",
+    "investors",
+    "stock",
+    "enterprise",
+    "executive",
+    # GOVERNMENT
+    "senate",
+    "congress",
+    "parliament",
+    "secretary",
+    "state",
+    "department of defense",
+    "dod",
+    "pentagon",
+    "secret service",
+    "nato",
+    "pentagon",
+    "cia",
+    "fbi",
+    "government",
+    "stimulus",
+    "mandate",
+    "ministry",
+    "minister",
+    "coalition",
+    "authorities",
+    # HEALTH
+    "health",
+    "pandemic",
+    "spreading rapidly",
+    "spreading across",
+    "outbreak",
+    "hot zone",
+    "panic",
+    "illness",
+    "virus",
+    "strain",
+    "vaccine",
+    "hospitals",
+    "medical centers",
+    "cdc",
+    # IMPACT
+    "major shift",
+    "sea change",
+    "major trend",
+    "amping up",
+    "once in a lifetime",
+    "vows to",
+    "catastrophy",
+    "disaster",
+    "destruction",
+    "unprecedented",
+    "declares",
+    "displaced",
+    "large scale",
+    "urges response",
+    "calls on",
+    "world record",
+    "world records",
+    "kills",
+    "dies",
+    "dies at",
+    "record",
+    "historic",
+    "faction",
+    "existential",
+    # INDUSTRY
+    "automotive",
+    "manufacturing",
+    "microchip",
+    "microprocessor",
+    "processor",
+    "travel",
+    "flight",
+    "airliner",
+    # SCIENCE
+    "science",
+    "archaeologists",
+    "biologists",
+    "scientists",
+    "habitable",
+    "mission",
+    "launches",
+    "quantum",
+    "once-in",
+    "mechanical",
+    "engineering",
+    "interstellar",
+    "discovers",
+    "element",
+    "uap",
+    "ufo",
+    "anomaly",
+    "cern",
+    "large hadron",
+    "metaphysics",
+    # TRADE
+    "trade",
+    "export",
+    "import",
+    "exports",
+    "imports",
+    "sanctions",
+    "seize",
+    "closing locations",
+    "trade war",
+    "impose tarrifs",
+    "port",
+    "union",
+    "accept bid",
+    "shortage",
+    "braces",
+    "tariffs",
+    "global trade",
+    "tarrif",
+    "manufacturing",
+    "supply chain",
+    "tsmc",
+    "shippers",
+    "shipping",
+    "route",
+    "distribution",
+    "transportation",
+    "workforce",
+    "forecast",
+    "free trade",
+    "restrictions",
+    # TECHNOLOGY
+    "technology",
+    "innovation",
+    "artifical intelligence",
+    "ai",
+    "machine learning",
+    "chatgpt",
+    "openai",
+    "anthropic",
+    "claude 3.5",
+    "decision intelligence",
+    "data mapping",
+    "autonomous",
+    "bleeding edge",
+    "next generation",
+    "revolutionary",
+    "visionary",
+    "data",
+    "engineering",
+    "software",
+    "saas",
+    "robot",
+    "robots",
+    "robotics",
+    "technology",
+    "satellite",
+    "comet",
+    "space",
+    "nasa",
+    "scientists",
+    "rocket",
+    "launch",
+    "spacecraft",
+    "expedition",
+    "pioneer",
+    "astrophysics",
+    "astronomy",
+    "radiation",
+    # PEOPLE
+    "warren buffet",
+    "musk",
+    "bill gates",
+    "tim cook",
+    "bezos",
+    "sam altman",
+    "powell",
+    "gensler",
+    "zelenky",
+    "zelenskiy",
+    "zelinskyy",
+    "putin",
+    "kim jung",
+    "xi",
+    "merkel",
+    "ken griffin",
+    "macron",
+    "trudeau",
+    "brian may",
+    # PEOPLE CATEGORIES
+    "boomers",
+    "gen-z",
+    "gen z",
+    "millenials",
+    # POLICY
+    "policy",
+    "supreme court",
+    "legistlation",
+    "committee",
+    "directive",
+    "legislature",
+    "laws",
+    "precedent",
+    # POLITICS
+    "government",
+    "political",
+    "pundit",
+    "election",
+    "leader",
+    "president",
+    "state",
+    "nation",
+    "global",
+    "regional",
+    "worldwide",
+    "presidency",
+    "prime minister",
+    "foreign minister",
+    "syndicate",
+    "speech",
+    "incumbent",
+    "constituent",
+    "border",
+    # POLITICS - US
+    "biden",
+    "harris",
+    "trump",
+    "vance",
+    "democracy",
+    "republican",
+    "democrat",
+    "liberal",
+    "gop",
+    "far-right",
+    "far-left",
+    # POLITICS - WORLD
+    "geopolitical",
+    "politics",
+    "campaign",
+    "world leaders",
+    "peace",
+    "international relations",
+    "diplomacy",
+    "historic",
+    "diplomatic",
+    "accord",
+    "international waters",
+    "international airspace",
+    "prince",
+    "king",
+    "queen",
+    "princess",
+    # REGULATION
+    "outlaw",
+    "censor",
+    "censored",
+    "censorship",
+    "regulation",
+    # REGIONAL
+    "hemisphere",
+    "united states",
+    "united kingdom",
+    "africa",
+    "israel",
+    "gaza",
+    "lebanon",
+    "iran",
+    "turkey",
+    "eu",
+    "europe",
+    "north korea",
+    "saudi",
+    "asia",
+    "middle east",
+    "russia",
+    "ukraine",
+    "china",
+    "india",
+    "taiwan",
+    "south america",
+    "mexico",
+    "north korea",
+    # UNREST
+    "revolution",
+    "protest",
+    "protestors",
+    "crisis",
+    "turmoil",
+    "looting",
+    # WAR & CONFLICT
+    "conflict",
+    "war",
+    "war against",
+    "war on",
+    "battleground",
+    "weapons",
+    "weapons material",
+    "intelligence agencies",
+    "intelligence agency",
+    "raid",
+    "radical",
+    "revolt",
+    "caliphate",
+    "insurgent",
+    "fugitive",
+    "intercepts",
+    "deploys",
+    "captured",
+    "destablizing",
+    "tensions",
+    "millitary action",
+    "independence",
+    "projectiles",
+    "elliminate",
+    "terrorist",
+    "faction",
+    "soldiers",
+    "troops",
+    "drills",
+    "front line",
+    "warplane",
+    "warship",
+    "shelling",
+    "bombing",
+    "air attack",
+    "expel",
+    "condemns",
+    "peacekeepers",
+    "pressure",
+    "asylum",
+    "migrant",
+    "migratory",
+    "attack",
+    "attacks",
+    "deadly",
+    "military",
+    "army",
+    "siege",
+    "embezzle",
+    "embezzling",
+    "coup",
+    "combat",
+    "fighting",
+    "infighting",
+    "hostage",
+    "negotiate",
+    "militia",
+    "anti-missile",
+    "relations",
+    "assassination",
+    "war crime",
+    "genocide",
+]
+
+# Some keywords are listed more than once and count once per listing; keys are
+# lowercased once here, since the text they're matched against is lowercased
+_PRIORITY_KEYWORD_WEIGHTS = Counter(keyword.lower() for keyword in PRIORITY_KEYWORDS)
+
+# Single-token keywords are matched as whole words with set lookups against the
+# text's tokens; the rest (multi-word or hyphenated) are matched as substrings
+_PRIORITY_TOKEN_RE = re.compile(r"[a-z0-9'+&]+")
+_PRIORITY_UNIGRAMS = frozenset(
+    keyword for keyword in _PRIORITY_KEYWORD_WEIGHTS if _PRIORITY_TOKEN_RE.fullmatch(keyword)
+)
+_PRIORITY_PHRASES = tuple(
+    keyword for keyword in _PRIORITY_KEYWORD_WEIGHTS if keyword not in _PRIORITY_UNIGRAMS
+)
+
+
+@lru_cache(maxsize=1)
+def _priority_automaton():
+    import ahocorasick
+
+    automaton = ahocorasick.Automaton()
+    for keyword in _PRIORITY_PHRASES:
+        automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+    return automaton
+
+
+def prioritize_headline(title, content):
     text = f"{title} {content}".lower()
-    return sum(1 for keyword in priority_keywords if keyword in text)
+    found = set(_PRIORITY_TOKEN_RE.findall(text)) & _PRIORITY_UNIGRAMS
+    if HAS_AHOCORASICK:
+        # One pass over the text finds every phrase, overlapping ones included
+        found.update(keyword for _, keyword in _priority_automaton().iter(text))
+    else:
+        found.update(keyword for keyword in _PRIORITY_PHRASES if keyword in text)
+    return sum(_PRIORITY_KEYWORD_WEIGHTS[keyword] for keyword in found)
+
 
 tag_bank = {
     # business
@@ -2509,114 +3345,246 @@ tag_bank = {
     ],
 }
 
-# Normalize the tag_bank keywords to lowercase
-tag_bank_lower = {
-    tag: [kw.lower() for kw in keywords] for tag, keywords in tag_bank.items()
-}
+def _is_word_char(text, idx):
+    return 0 <= idx < len(text) and (text[idx].isalnum() or text[idx] == "_")
+
+
+class WholeWordMatcher:
+    """
+    Finds which of a fixed set of lowercase keywords occur in a text as whole
+    words, as one \\b-delimited regex per keyword would, but in a single pass:
+    with an Aho-Corasick automaton if pyahocorasick is installed, otherwise
+    with one alternation regex.
+
+    Parameters:
+    - keywords (Iterable[str]): The lowercase keywords to look for.
+    """
+
+    def __init__(self, keywords):
+        self.keywords = tuple(dict.fromkeys(keywords))
+
+    # The automaton and the regex are each built on first use, so importing the
+    # module compiles neither, and only the one in use is ever built
+
+    @cached_property
+    def regex(self):
+        # The lookahead makes every match zero-width, so matches may overlap;
+        # longest first, the regex reports the longest keyword at each position
+        alternation = "|".join(
+            re.escape(kw) for kw in sorted(self.keywords, key=len, reverse=True)
+        )
+        return re.compile(rf"(?=\b({alternation})\b)")
+
+    @cached_property
+    def prefixes(self):
+        # Shorter keywords found at the same position are whole-word prefixes of
+        # the reported one, which depends only on the keyword itself
+        keyword_set = set(self.keywords)
+        return {
+            kw: [
+                kw[:end]
+                for end in range(1, len(kw))
+                if kw[:end] in keyword_set and _is_word_char(kw, end - 1) != _is_word_char(kw, end)
+            ]
+            for kw in self.keywords
+        }
+
+    @cached_property
+    def automaton(self):
+        import ahocorasick
+
+        automaton = ahocorasick.Automaton()
+        for kw in self.keywords:
+            automaton.add_word(kw, kw)
+        automaton.make_automaton()
+        return automaton
+
+    def findall(self, text_lower) -> set:
+        """
+        Parameters:
+        - text_lower (str): The lowercased text to scan.
+
+        Returns:
+        - set: The distinct keywords found.
+        """
+        if not self.keywords:
+            return set()
+
+        found = set()
+        if HAS_AHOCORASICK:
+            for end, kw in self.automaton.iter(text_lower):
+                start = end - len(kw) + 1
+                # \b holds where a word character meets a non-word character
+                if (
+                    _is_word_char(text_lower, start - 1) != _is_word_char(text_lower, start)
+                    and _is_word_char(text_lower, end) != _is_word_char(text_lower, end + 1)
+                ):
+                    found.add(kw)
+        else:
+            for match in self.regex.finditer(text_lower):
+                kw = match.group(1)
+                found.add(kw)
+                found.update(self.prefixes[kw])
+        return found
+
+
+@lru_cache(maxsize=1)
+def country_names():
+    """
+    Lowercased names of every country, official and common names included, in
+    pycountry's order (so meta tag ties break the same way on every run).
+    """
+    names = {}
+    for country in pycountry.countries:
+        for attr in ("name", "official_name", "common_name"):
+            name = getattr(country, attr, None)
+            if name:
+                names[name.lower()] = None
+    return tuple(names)
+
+
+countries = country_names()
+
+# Every meta tag gets a small integer id: the tag_bank categories first, then
+# one per country name. Each lowercased keyword maps to the ids it counts
+# toward (a keyword may sit in more than one category)
+TAG_LABELS = list(dict.fromkeys([*tag_bank, *(country.title() for country in countries)]))
+_TAG_LABEL_IDS = {label: idx for idx, label in enumerate(TAG_LABELS)}
+_TAG_KEYWORD_IDS = defaultdict(list)
+for tag, keywords in tag_bank.items():
+    for kw in keywords:
+        _TAG_KEYWORD_IDS[kw.lower()].append(_TAG_LABEL_IDS[tag])
+for country in countries:
+    _TAG_KEYWORD_IDS[country].append(_TAG_LABEL_IDS[country.title()])
+_TAG_KEYWORD_IDS = {kw: tuple(dict.fromkeys(ids)) for kw, ids in _TAG_KEYWORD_IDS.items()}
+
+_TAG_MATCHER = WholeWordMatcher(_TAG_KEYWORD_IDS)
+
+
+def tag_scores(text_lower):
+    """
+    Count, for every label in TAG_LABELS, how many distinct keywords of that tag
+    (or country) occur in a text.
+
+    Parameters:
+    - text_lower (str): The lowercased text to scan.
+
+    Returns:
+    - numpy.ndarray: Integer scores indexed like TAG_LABELS.
+    """
+    hits = [tag_id for kw in _TAG_MATCHER.findall(text_lower) for tag_id in _TAG_KEYWORD_IDS[kw]]
+    return np.bincount(np.asarray(hits, dtype=np.intp), minlength=len(TAG_LABELS))
 
-# Precompile patterns for tag bank
-tag_patterns = {}
-for tag, keywords in tag_bank_lower.items():
-    patterns = [re.compile(r"\b" + re.escape(kw) + r"\b") for kw in keywords]
-    tag_patterns[tag] = patterns
-
-countries = {country.name.lower() for country in pycountry.countries}
-for country in pycountry.countries:
-    if hasattr(country, "official_name"):
-        countries.add(country.official_name.lower())
-    if hasattr(country, "common_name"):
-        countries.add(country.common_name.lower())
-
-# Build a list of tuples with country names and compiled patterns
-country_patterns = [
-    (country, re.compile(r"\b" + re.escape(country) + r"\b")) for country in countries
-]
 
 meta_tag_stopwords = set(stopwords.words("english")).union({"sponsor"})
 
+# Hashtag for each label in TAG_LABELS, or None for labels never shown as tags
+TAG_HASHTAGS = [
+    f"#{tag.replace(' ', '')}" if tag.lower() not in meta_tag_stopwords and len(tag) > 1 else None
+    for tag in TAG_LABELS
+]
+
+
+# Display names for source domains, for the common cases where the capitalized
+# registered domain reads badly
+SOURCE_NAMES = {
+    "nytimes": "New York Times",
+    "bbc": "BBC",
+    "cnn": "CNN",
+    "theguardian": "The Guardian",
+    "wsj": "WSJ",
+    "ft": "Financial Times",
+    "latimes": "LA Times",
+    "npr": "NPR",
+    "apnews": "Associated Press",
+    "reuters": "Reuters",
+    "forbes": "Forbes",
+    "bloomberg": "Bloomberg",
+    "coindesk": "CoinDesk",
+    "businessinsider": "Business Insider",
+    "techcrunch": "TechCrunch",
+    "cnbc": "CNBC",
+    "nypost": "NY Post",
+    "thehill": "The Hill",
+    "ndtv": "Adani Group",
+    "marketwatch": "MarketWatch",
+    "investopedia": "Investopedia",
+    "seekingalpha": "Seeking Alpha",
+    "firstpost": "Firstpost",
+    "Lemonde": "Le Monde",
+    "dw": "Deutsche Welle",
+    "feedburner": "FeedBurner",
+    "feedx": "X",
+    "co": "CO",
+    "msn": "MSN",
+    "qz": "Quartz",
+    "nbcnews": "NBC News",
+    "arstechnica": "Ars Technica",
+    "cbsnews": "CBS News",
+    "abcnews": "ABC News",
+    "huffpost": "Huffington Post",
+    "axios": "Axios",
+    "politico": "Politico",
+    "washingtonpost": "Washington Post",
+    "go": "ABC News",
+    "theregister": "The Register",
+    "aljazeera": "Al Jazeera",
+    "krebsonsecurity": "Krebs On Security",
+    "sans": "SANS Internet Storm Center",
+    #blacklisted outlets
+    "dnyuz": "!blacklisted outlet!",
+    # Add more mappings as needed
+}
+
+
+# The bundled public suffix list, so resolving sources never waits on a download
+_TLD_EXTRACT = tldextract.TLDExtract(suffix_list_urls=())
+
+
+@lru_cache(maxsize=2048)
+def get_source_name(url):
+    # The same outlets recur across clusters, so most lookups are cache hits
+    domain = _TLD_EXTRACT(url).domain
+    return SOURCE_NAMES.get(domain, domain.capitalize())
+
 
 def aggregate_headlines_and_generate_tags(clustered_articles):
     logging.info("Aggregating headlines and generating meta tags...")
     aggregated_headlines = []
-    stop_words = set(stopwords.words('english'))
-
-    # Define get_source_name function here
-    def get_source_name(url):
-        ext = tldextract.extract(url)
-        domain = ext.domain
-        # Handle common cases for better names
-        domain_mappings = {
-            "nytimes": "New York Times",
-            "bbc": "BBC",
-            "cnn": "CNN",
-            "theguardian": "The Guardian",
-            "wsj": "WSJ",
-            "ft": "Financial Times",
-            "latimes": "LA Times",
-            "npr": "NPR",
-            "apnews": "Associated Press",
-            "reuters": "Reuters",
-            "forbes": "Forbes",
-            "bloomberg": "Bloomberg",
-            "coindesk": "CoinDesk",
-            "businessinsider": "Business Insider",
-            "techcrunch": "TechCrunch",
-            "cnbc": "CNBC",
-            "nypost": "NY Post",
-            "thehill": "The Hill",
-            "ndtv": "Adani Group",
-            "marketwatch": "MarketWatch",
-            "investopedia": "Investopedia",
-            "seekingalpha": "Seeking Alpha",
-            "firstpost": "Firstpost",
-            "Lemonde": "Le Monde",
-            "dw": "Deutsche Welle",
-            "feedburner": "FeedBurner",
-            "feedx": "X",
-            "co": "CO",
-            "msn": "MSN",
-            "qz": "Quartz",
-            "nbcnews": "NBC News",
-            "arstechnica": "Ars Technica",
-            "cbsnews": "CBS News",
-            "abcnews": "ABC News",
-            "huffpost": "Huffington Post",
-            "axios": "Axios",
-            "politico": "Politico",
-            "washingtonpost": "Washington Post",
-            "firstpost": "Firstpost",
-            "go": "ABC News",
-            "theregister": "The Register",
-            "aljazeera": "Al Jazeera",
-            "krebsonsecurity": "Krebs On Security",
-            "sans": "SANS Internet Storm Center",
-            #blacklisted outlets
-            "dnyuz": "!blacklisted outlet!",
-            # Add more mappings as needed
-        }
 
-        source_name = domain_mappings.get(domain, domain.capitalize())
-        return source_name
-
-
-    for cluster_idx, cluster in clustered_articles.items():
-        article_count = len(cluster)
-        if article_count < 3:
-            logging.info(
-                f"Skipping aggregated headline with {article_count} articles: {cluster[0]['title']}"
-            )
-            continue
+    # Only clusters of three or more articles get a headline; most clusters are
+    # single noise articles, so they are counted rather than logged one by one
+    large_clusters = [
+        (cluster_idx, cluster)
+        for cluster_idx, cluster in clustered_articles.items()
+        if len(cluster) >= 3
+    ]
+    logging.info(
+        f"Skipping {len(clustered_articles) - len(large_clusters)} clusters with fewer than 3 articles"
+    )
 
-        titles = [article["title"] for article in cluster if article["title"]]
+    # Combine each cluster's titles into one text
+    combined_titles_by_cluster = {}
+    for cluster_idx, cluster in large_clusters:
+        titles = list(filter(None, (article["title"] for article in cluster)))
         if not titles:
             logging.info(f"No titles found in cluster {cluster_idx}, skipping.")
             continue
 
-        # Combine titles into one text
-        combined_titles = ' '.join(titles)
+        combined_titles_by_cluster[cluster_idx] = ' '.join(titles)
+
+    # Generate a coherent headline for every cluster using the summarizer, in
+    # batches rather than one generate() call per cluster
+    headlines_by_cluster = dict(
+        zip(
+            combined_titles_by_cluster,
+            generate_headlines(list(combined_titles_by_cluster.values())),
+        )
+    )
 
-        # Generate a coherent headline using the summarizer
-        aggregated_headline = generate_headline(combined_titles)
+    for cluster_idx, aggregated_headline in headlines_by_cluster.items():
+        cluster = clustered_articles[cluster_idx]
+        article_count = len(cluster)
 
         if not is_valid_headline(aggregated_headline):
             logging.info(f"Skipping invalid headline: {aggregated_headline}")
@@ -2625,49 +3593,37 @@ def aggregate_headlines_and_generate_tags(clustered_articles):
         combined_text = aggregated_headline
         combined_text_lower = combined_text.lower()
 
-        meta_tags = []
-        tag_counter = defaultdict(int)
-
-        # Use precompiled patterns for tag bank matching
-        for tag, patterns in tag_patterns.items():
-            for pattern in patterns:
-                if pattern.search(combined_text_lower):
-                    tag_counter[tag] += 1  # Increment by 1 to avoid overcounting
-
-        # Use precompiled patterns for country matching
-        for country_name, pattern in country_patterns:
-            if pattern.search(combined_text_lower):
-                tag_counter[country_name.title()] += 1
-
-        most_common_tags = sorted(
-            tag_counter.items(), key=lambda x: x[1], reverse=True
-        )[:5]
-        for tag, _ in most_common_tags:
-            if tag.lower() not in meta_tag_stopwords and len(tag) > 1:
-                meta_tags.append(f"#{tag.replace(' ', '')}")
-
-        meta_tags = list(dict.fromkeys(meta_tags))[:5]
-
-        publish_dates = [
-            article.get("publish_datetime")
-            for article in cluster
-            if article.get("publish_datetime")
-        ]
-        if publish_dates:
-            latest_date = max(publish_dates)
-            latest_article = max(
-                cluster, key=lambda x: x.get("publish_datetime", date.min)
-            )
-            latest_publish_date = latest_article.get("publish_datetime")
+        # Score every tag and country in one pass over the text, then take the
+        # five highest, ties kept in TAG_LABELS order
+        scores = tag_scores(combined_text_lower)
+        matched = np.flatnonzero(scores)
+        most_common_tags = matched[np.argsort(-scores[matched], kind="stable")][:5]
+
+        # Distinct hashtags in rank order, accumulated in one ordered dict
+        meta_tags = {}
+        for tag_id in most_common_tags:
+            hashtag = TAG_HASHTAGS[tag_id]
+            if hashtag is not None:
+                meta_tags[hashtag] = None
+        meta_tags = list(meta_tags)
+
+        # One pass finds the most recent article that has a publish date
+        latest_article = max(
+            (article for article in cluster if article.get("publish_datetime")),
+            key=itemgetter("publish_datetime"),
+            default=None,
+        )
+        if latest_article is not None:
+            latest_publish_date = latest_article["publish_datetime"]
             try:
                 if isinstance(latest_article.get("publish_date"), str):
-                    latest_datetime = date_parser.parse(
+                    latest_datetime = fast_parse_date(
                         latest_article.get("publish_date")
-                    ).astimezone(ZoneInfo("America/Chicago"))
+                    ).astimezone(CENTRAL_TZ)
                 else:
                     latest_datetime = datetime.combine(
                         latest_publish_date, datetime.min.time()
-                    ).astimezone(ZoneInfo("America/Chicago"))
+                    ).astimezone(CENTRAL_TZ)
             except Exception as e:
                 logging.error(
                     f"Error processing publish date for cluster '{aggregated_headline}': {e}"
@@ -2678,7 +3634,9 @@ def aggregate_headlines_and_generate_tags(clustered_articles):
             )
         else:
             time_display = ""
-            latest_datetime = None  # Ensure latest_datetime is defined
+            # Ensure both are defined
+            latest_publish_date = None
+            latest_datetime = None
 
         # Use the source_links block to create hyperlinked source names
         source_links = []
@@ -2726,37 +3684,175 @@ def aggregate_headlines_and_generate_tags(clustered_articles):
     return aggregated_headlines
 
 
+# Model that writes each cluster's headline from its combined titles; the
+# distilled BART keeps half of bart-large-cnn's decoder layers
+HEADLINE_MODEL = "sshleifer/distilbart-cnn-12-6"
+
+
+def generation_dtype(device, fp16_safe: bool = True):
+    """
+    Picks the precision to load a seq2seq model in: half precision on CUDA, which
+    halves weight and KV-cache traffic during beam search, and float32 on CPU.
+    Models that overflow in float16 (T5) get bfloat16 where the GPU supports it.
+    """
+    if device.type != "cuda":
+        return torch.float32
+    if fp16_safe:
+        return torch.float16
+    return torch.bfloat16 if torch.cuda.is_bf16_supported() else torch.float32
+
+
+def load_headline_model(device):
+    """
+    Loads the headline tokenizer and model. On CPU hosts with the onnx extra the
+    model runs on ONNX Runtime, from an export built once under the cache
+    directory; otherwise it runs in PyTorch.
+    """
+    if device.type == "cpu" and HAS_OPTIMUM:
+        try:
+            from optimum.onnxruntime import ORTModelForSeq2SeqLM
+
+            export_dir = os.path.join(CACHE_DIR, f"{HEADLINE_MODEL.replace('/', '--')}-onnx")
+            # The tokenizer is saved last, so its config marks a complete export
+            if not os.path.exists(os.path.join(export_dir, "tokenizer_config.json")):
+                logging.info(f"Exporting {HEADLINE_MODEL} to ONNX in {export_dir}")
+                ORTModelForSeq2SeqLM.from_pretrained(HEADLINE_MODEL, export=True).save_pretrained(export_dir)
+                transformers.AutoTokenizer.from_pretrained(HEADLINE_MODEL).save_pretrained(export_dir)
+            return (
+                transformers.AutoTokenizer.from_pretrained(export_dir),
+                ORTModelForSeq2SeqLM.from_pretrained(export_dir),
+            )
+        except Exception as e:
+            logging.warning(f"ONNX headline model unavailable, using PyTorch on CPU: {e}")
+
+    tokenizer = transformers.AutoTokenizer.from_pretrained(HEADLINE_MODEL)
+    model = transformers.AutoModelForSeq2SeqLM.from_pretrained(
+        HEADLINE_MODEL, torch_dtype=generation_dtype(device)
+    ).to(device).eval()
+    return tokenizer, model
+
+
+class HeadlineCache:
+    """
+    On-disk cache of generated headlines, keyed by a hash of the exact input
+    text, so clusters whose combined titles were already seen (in this run or an
+    earlier one) skip beam search.
+    """
+
+    def __init__(self, model_name: str, cache_dir: str = CACHE_DIR):
+        self.path = os.path.join(cache_dir, f"headlines-{model_name.replace('/', '--')}.sqlite")
+        self.conn = None
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            self.conn = sqlite3.connect(self.path)
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache (hash INTEGER PRIMARY KEY, headline TEXT)"
+            )
+        except (OSError, sqlite3.Error) as e:
+            logging.warning(f"Headline cache unavailable, generating all headlines: {e}")
+            self.conn = None
+
+    @staticmethod
+    def key(text: str) -> int:
+        # The model is cased, so the text is hashed exactly as given
+        digest = hashlib.blake2b(text.encode("utf-8"), digest_size=8).digest()
+        return int.from_bytes(digest, "little", signed=True)
+
+    def get(self, text: str) -> Optional[str]:
+        if self.conn is None:
+            return None
+        row = self.conn.execute(
+            "SELECT headline FROM cache WHERE hash = ?", (self.key(text),)
+        ).fetchone()
+        return row[0] if row else None
+
+    def store(self, items):
+        if self.conn is None:
+            return
+        try:
+            with self.conn:
+                self.conn.executemany(
+                    "INSERT OR REPLACE INTO cache (hash, headline) VALUES (?, ?)",
+                    [(self.key(text), headline) for text, headline in items],
+                )
+        except sqlite3.Error as e:
+            logging.warning(f"Could not write headline cache: {e}")
+
+
+@lru_cache(maxsize=None)
+def get_headline_cache(model_name: str) -> HeadlineCache:
+    # One open cache connection per model for the life of the process
+    return HeadlineCache(model_name)
+
+
+def generate_headlines(texts: List[str], batch_size: int = 16) -> List[str]:
+    """
+    Writes one headline per text (a cluster's combined titles), running the
+    texts not found in the headline cache through the model in padded batches.
+
+    Parameters:
+    - texts (List[str]): The texts to write headlines for.
+    - batch_size (int): Texts per generate() call.
+
+    Returns:
+    - List[str]: One headline per text, 'Untitled Headline' where generation failed.
+    """
+    cache = get_headline_cache(HEADLINE_MODEL)
+    headlines = {}
+    for text in texts:
+        if text not in headlines:
+            headlines[text] = cache.get(text)
+    missing = [text for text, headline in headlines.items() if headline is None]
+
+    if missing:
+        logging.info(f"Generating {len(missing)} headlines ({len(headlines) - len(missing)} cached)")
+    for i in range(0, len(missing), batch_size):
+        batch_texts = missing[i:i+batch_size]
+        try:
+            HAS_TRANSFORMERS.require_now("generate_headlines")
+            device = torch.device('cuda' if torch.cuda.is_available() else 'cpu')
+
+            if not hasattr(generate_headlines, "model"):
+                generate_headlines.tokenizer, generate_headlines.model = load_headline_model(device)
+
+            inputs = generate_headlines.tokenizer(
+                batch_texts,
+                return_tensors="pt",
+                max_length=512,
+                truncation=True,
+                padding=True
+            ).to(device)
+
+            with torch.inference_mode():
+                outputs = generate_headlines.model.generate(
+                    input_ids=inputs["input_ids"],
+                    attention_mask=inputs["attention_mask"],
+                    max_length=30,
+                    min_length=10,
+                    length_penalty=1.0,
+                    num_beams=4,
+                    early_stopping=True,
+                    no_repeat_ngram_size=3
+                )
+            batch_headlines = [
+                fix_text(generate_headlines.tokenizer.decode(output, skip_special_tokens=True))
+                .strip()
+                .rstrip('.')
+                for output in outputs
+            ]
+        except Exception as e:
+            logging.error(f"Error generating headlines: {e}")
+            continue
+
+        headlines.update(zip(batch_texts, batch_headlines))
+        # Only real headlines are cached, never the fallback
+        cache.store(zip(batch_texts, batch_headlines))
+
+    return [headlines[text] or 'Untitled Headline' for text in texts]
+
+
 def generate_headline(text):
-    try:
-        device = torch.device('cuda' if torch.cuda.is_available() else 'cpu')
-        
-        if not hasattr(generate_headline, "model"):
-            generate_headline.tokenizer = AutoTokenizer.from_pretrained("facebook/bart-large-cnn")
-            generate_headline.model = AutoModelForSeq2SeqLM.from_pretrained("facebook/bart-large-cnn").to(device)
-        
-        input_ids = generate_headline.tokenizer.encode(
-            text,
-            return_tensors="pt",
-            max_length=512,
-            truncation=True
-        ).to(device)
-        
-        outputs = generate_headline.model.generate(
-            input_ids,
-            max_length=30,
-            min_length=10,
-            length_penalty=1.0,
-            num_beams=4,
-            early_stopping=True,
-            no_repeat_ngram_size=3
-        )
-        headline = generate_headline.tokenizer.decode(outputs[0], skip_special_tokens=True)
-        headline = fix_text(headline)
-        headline = headline.strip().rstrip('.')
-        return headline
-    except Exception as e:
-        logging.error(f"Error generating headline: {e}")
-        return 'Untitled Headline'
+    return generate_headlines([text])[0]
 
 
 def group_headlines(aggregated_headlines: List[Dict]) -> Dict:
@@ -3046,69 +4142,52 @@ ACTION_KEYWORDS = {
     ],
 }
 
-# Compile patterns for impact high keywords
-impact_patterns_high = [
-    re.compile(r"\b" + re.escape(kw.lower()) + r"\b") for kw in IMPACT_KEYWORDS["high"]
-]
+# Net weight of each lowercased keyword in the impact and action scores: +1
+# for each time it is listed as high, -1 for each time it is listed as low
+_IMPACT_WEIGHTS = Counter(kw.lower() for kw in IMPACT_KEYWORDS["high"])
+_IMPACT_WEIGHTS.subtract(kw.lower() for kw in IMPACT_KEYWORDS["low"])
+_ACTION_WEIGHTS = Counter(kw.lower() for kw in ACTION_KEYWORDS["high_action"])
+_ACTION_WEIGHTS.subtract(kw.lower() for kw in ACTION_KEYWORDS["low_action"])
 
-# Compile patterns for impact low keywords
-impact_patterns_low = [
-    re.compile(r"\b" + re.escape(kw.lower()) + r"\b") for kw in IMPACT_KEYWORDS["low"]
-]
+_SCORE_MATCHER = WholeWordMatcher([*_IMPACT_WEIGHTS, *_ACTION_WEIGHTS])
 
-# Compile patterns for action high keywords
-action_patterns_high = [
-    re.compile(r"\b" + re.escape(kw.lower()) + r"\b")
-    for kw in ACTION_KEYWORDS["high_action"]
-]
 
-# Compile patterns for action low keywords
-action_patterns_low = [
-    re.compile(r"\b" + re.escape(kw.lower()) + r"\b")
-    for kw in ACTION_KEYWORDS["low_action"]
-]
+# Syndicated titles repeat across feeds, and VADER dominates the cost of a call,
+# so memoize; the scores depend only on the text
+@lru_cache(maxsize=1 << 16)
+def calculate_scores_for_headline(headline_text, headline_lower=None):
+    # Convert headline to lowercase for case-insensitive matching, unless the
+    # caller already has it lowercased
+    if headline_lower is None:
+        headline_lower = headline_text.lower()
 
-def calculate_scores_for_headline(headline_text):
     # Use VADER for sentiment analysis
-    sentiment = sentiment_analyzer.polarity_scores(headline_text)
+    sentiment = get_vader().polarity_scores(headline_text)
     compound_score = sentiment[
         "compound"
     ]  # VADER returns a compound score between -1 and 1
 
+    # Fold in the multi-word news phrases VADER can't see: recover VADER's raw
+    # valence sum from the compound score (x / sqrt(x^2 + 15)), add the phrase
+    # valences and normalize again
+    extra_valence = phrase_score(headline_lower)
+    if extra_valence:
+        compound_score = max(min(compound_score, 0.9999), -0.9999)
+        valence = compound_score * math.sqrt(15 / (1 - compound_score ** 2))
+        valence += extra_valence
+        compound_score = valence / math.sqrt(valence ** 2 + 15)
+
     # Scale the compound score to a range from -5 to 5
     sentiment_score = compound_score * 5
 
-    # Initialize impact and action scores
-    impact_score = 0
-    action_score = 0
+    # Find every impact and action keyword in one pass over the headline
+    found = _SCORE_MATCHER.findall(headline_lower)
 
-    # Convert headline to lowercase for case-insensitive matching
-    headline_lower = headline_text.lower()
-
-    # Match impact high keywords using precompiled patterns
-    for pattern in impact_patterns_high:
-        if pattern.search(headline_lower):
-            impact_score += 1  # Increment by 1 per keyword found
-
-    # Match impact low keywords using precompiled patterns
-    for pattern in impact_patterns_low:
-        if pattern.search(headline_lower):
-            impact_score -= 1  # Decrement by 1 per keyword found
-
-    # Normalize impact score to -5 to 5 range
+    # Each keyword found adds 1 per high listing and subtracts 1 per low listing;
+    # normalize both scores to the -5 to 5 range
+    impact_score = sum(_IMPACT_WEIGHTS[kw] for kw in found)
     impact_score = max(min(impact_score, 5), -5)
-
-    # Match action high keywords using precompiled patterns
-    for pattern in action_patterns_high:
-        if pattern.search(headline_lower):
-            action_score += 1  # Increment by 1 per keyword found
-
-    # Match action low keywords using precompiled patterns
-    for pattern in action_patterns_low:
-        if pattern.search(headline_lower):
-            action_score -= 1  # Decrement by 1 per keyword found
-
-    # Normalize action score to -5 to 5 range
+    action_score = sum(_ACTION_WEIGHTS[kw] for kw in found)
     action_score = max(min(action_score, 5), -5)
 
     return sentiment_score, impact_score, action_score
@@ -3129,15 +4208,22 @@ def calculate_scores_for_headline(headline_text):
 
 def generate_summaries(text_list: List[str], batch_size: int = 8) -> List[str]:
     try:
+        HAS_TRANSFORMERS.require_now("generate_summaries")
         device = torch.device('cuda' if torch.cuda.is_available() else 'cpu')
         
         if not hasattr(generate_summaries, "model"):
-            generate_summaries.tokenizer = AutoTokenizer.from_pretrained("t5-small")
-            generate_summaries.model = AutoModelForSeq2SeqLM.from_pretrained("t5-small").to(device)
+            generate_summaries.tokenizer = transformers.AutoTokenizer.from_pretrained("t5-small")
+            generate_summaries.model = transformers.AutoModelForSeq2SeqLM.from_pretrained(
+                "t5-small", torch_dtype=generation_dtype(device, fp16_safe=False)
+            ).to(device).eval()
         
-        summaries = []
-        for i in range(0, len(text_list), batch_size):
-            batch_texts = text_list[i:i+batch_size]
+        # Batch texts of similar length together so little of each batch is
+        # padding; the summaries are put back in input order
+        order = sorted(range(len(text_list)), key=lambda idx: len(text_list[idx]))
+        summaries = [''] * len(text_list)
+        for i in range(0, len(order), batch_size):
+            batch_indices = order[i:i+batch_size]
+            batch_texts = [text_list[idx] for idx in batch_indices]
             inputs = generate_summaries.tokenizer(
                 ["summarize: " + text for text in batch_texts],
                 return_tensors="pt",
@@ -3146,16 +4232,17 @@ def generate_summaries(text_list: List[str], batch_size: int = 8) -> List[str]:
                 padding=True
             ).to(device)
             
-            outputs = generate_summaries.model.generate(
-                input_ids=inputs["input_ids"],
-                attention_mask=inputs["attention_mask"],
-                max_length=80,  
-                min_length=40,
-                length_penalty=1.5,
-                num_beams=4,
-                early_stopping=True,
-                no_repeat_ngram_size=3
-            )
+            with torch.inference_mode():
+                outputs = generate_summaries.model.generate(
+                    input_ids=inputs["input_ids"],
+                    attention_mask=inputs["attention_mask"],
+                    max_length=80,  
+                    min_length=40,
+                    length_penalty=1.5,
+                    num_beams=4,
+                    early_stopping=True,
+                    no_repeat_ngram_size=3
+                )
             
             batch_summaries = [
                 generate_summaries.tokenizer.decode(output, skip_special_tokens=True)
@@ -3164,7 +4251,8 @@ def generate_summaries(text_list: List[str], batch_size: int = 8) -> List[str]:
             
             # Post-process summaries
             batch_summaries = [fix_text(summary).strip() for summary in batch_summaries]
-            summaries.extend(batch_summaries)
+            for idx, summary in zip(batch_indices, batch_summaries):
+                summaries[idx] = summary
         
         return summaries
     
@@ -3184,24 +4272,56 @@ async def generate_summaries_async(text_list: List[str], batch_size: int = 8, ti
         return ['Summary not available.' for _ in text_list]
 
 
+# A pure function of its input, and the NLTK tagging below dominates its cost;
+# headlines and summaries that repeat are fixed only once
+_SPACE_BEFORE_PUNCT_RE = re.compile(r'\s+([?.!,"])')
+
+
+@lru_cache(maxsize=4096)
 def fix_text(text: str) -> str:
     # Fix contractions and capitalization
-    text = contractions.fix(text)
-    text = re.sub(r'\s+([?.!,"])', r'\1', text)
-    sentences = nltk.sent_tokenize(text)
+    text = fix_contractions(text)
+    text = _SPACE_BEFORE_PUNCT_RE.sub(r'\1', text)
+    if any(end in text for end in ".?!"):
+        sentences = nltk.sent_tokenize(text)
+    else:
+        # Punkt only breaks at these characters; without one (most generated
+        # headlines) it returns the text right-stripped, or nothing if blank
+        sentences = [text.rstrip()] if text.strip() else []
     sentences = [s.capitalize() for s in sentences]
     # Capitalize proper nouns
     text = capitalize_proper_nouns(' '.join(sentences))
     return text.strip()
 
     
-def preprocess_article_content(content: str, max_length: int = 10000) -> str:
-    # Remove HTML tags
-    clean_text = re.sub('<.*?>', '', content)
+# Same matches as "<.*?>" (which stops at newlines), without its backtracking
+_INLINE_TAG_RE = re.compile(r"<[^>\n]*>")
+_URL_RE = re.compile(r"http\S+")
+
+
+def _clean_article_text(text: str) -> str:
+    # Remove HTML tags; text that was already cleaned has no "<" at all, and
+    # checking for one is far cheaper than running the regex
+    if "<" in text:
+        text = _INLINE_TAG_RE.sub('', text)
     # Remove URLs
-    clean_text = re.sub(r'http\S+', '', clean_text)
+    text = _URL_RE.sub('', text)
     # Normalize whitespace
-    clean_text = ' '.join(clean_text.split())
+    return ' '.join(text.split())
+
+
+def preprocess_article_content(content: str, max_length: int = 10000) -> str:
+    # None of the cleaning passes can match across a newline, so a prefix cut at
+    # one cleans to a prefix of the full result; when that already fills
+    # max_length the rest of a long article is never scanned
+    window = 2 * max_length
+    if len(content) > window:
+        cut = content.find("\n", window)
+        if cut != -1:
+            clean_text = _clean_article_text(content[:cut])
+            if len(clean_text) > max_length:
+                return clean_text[:max_length] + "..."
+    clean_text = _clean_article_text(content)
     # Truncate to maximum length
     if len(clean_text) > max_length:
         clean_text = clean_text[:max_length] + "..."
@@ -3225,7 +4345,8 @@ def preprocess_article_content(content: str, max_length: int = 10000) -> str:
 
 async def prepare_email_content(grouped_headlines: Dict) -> str:
     logging.info("Preparing HTML email content...")
-    email_content = ""
+    # Pieces of the HTML, joined once at the end rather than concatenated
+    email_parts = []
 
     def divider():
         return "<hr style='border:1px solid #ccc;'>\n"
@@ -3235,18 +4356,7 @@ async def prepare_email_content(grouped_headlines: Dict) -> str:
             headline_text = headline_text[: headline_text.rfind(" - ")]
         return headline_text
 
-    current_day = datetime.now(ZoneInfo("America/Chicago")).strftime("%A")
-    days_order = [
-        "Monday",
-        "Tuesday",
-        "Wednesday",
-        "Thursday",
-        "Friday",
-        "Saturday",
-        "Sunday",
-    ]
-    today_index = days_order.index(current_day) if current_day in days_order else 0
-    ordered_days = days_order[today_index:] + days_order[:today_index]
+    current_year = datetime.now().year
 
     def parse_day_date(x):
         try:
@@ -3255,7 +4365,7 @@ async def prepare_email_content(grouped_headlines: Dict) -> str:
             try:
                 date_without_year = datetime.strptime(x.split(", ")[1], "%B %d")
                 # Assign current year
-                date_with_year = date_without_year.replace(year=datetime.now().year)
+                date_with_year = date_without_year.replace(year=current_year)
                 return date_with_year
             except ValueError:
                 logging.error(
@@ -3264,9 +4374,9 @@ async def prepare_email_content(grouped_headlines: Dict) -> str:
                 return datetime.min
 
     try:
-        sorted_keys = sorted(
-            grouped_headlines.keys(), key=lambda x: parse_day_date(x), reverse=True
-        )
+        # Parse each day key once up front rather than inside the sort key
+        parsed_days = {key: parse_day_date(key) for key in grouped_headlines}
+        sorted_keys = sorted(grouped_headlines, key=parsed_days.__getitem__, reverse=True)
     except Exception as e:
         logging.error(f"Error during sorting: {e}")
         sorted_keys = grouped_headlines.keys()
@@ -3276,22 +4386,24 @@ async def prepare_email_content(grouped_headlines: Dict) -> str:
     else:
         logging.info(f"Preparing content for {len(sorted_keys)} headline groups.")
 
+    # Collect every day's items and texts first, so all summaries can be
+    # generated in one batched call instead of one call per day
+    items_by_key = {}
+    texts_to_summarize = []
+    items_to_summarize = []
+    keys_to_summarize = set()
+    # Groups sharing the same top articles yield identical texts; each
+    # distinct text is summarized once and the items point at its index
+    text_indices = {}
+    item_text_indices = []
     for key in sorted_keys:
         headlines = grouped_headlines[key]
-        headline_count = len(headlines)
-        
-        if headline_count == 0:
+
+        if not headlines:
             logging.warning(f"No headlines to display for key {key}")
             continue
-        
-        email_content += f"<h2>{key} ({headline_count} highlights)</h2>\n"
-        email_content += divider()
-        email_content += "<br>"
-        
-        # Collect texts and items for batch processing
-        texts_to_summarize = []
-        items_to_summarize = []
 
+        items_by_key[key] = []
         for item in headlines:
             headline = clean_headline(item["headline"])
             meta_tags = " ".join(item["meta_tags"]) if item["meta_tags"] else ""
@@ -3299,41 +4411,50 @@ async def prepare_email_content(grouped_headlines: Dict) -> str:
             sources_str = item["sources_str"] if item["sources_str"] else "N/A"
             
             # Collect and preprocess contents of the top 3 articles
-            combined_content = ""
+            content_chunks = []
             top_articles = item["articles"][:3]
             for article in top_articles:
                 content = article.get('preprocessed_content', '')
                 if content:
                     clean_content = preprocess_article_content(content)
-                    combined_content += ' ' + clean_content
+                    if clean_content:
+                        content_chunks.append(clean_content)
+            combined_content = ' '.join(content_chunks)
+
+            email_item = {
+                "headline": headline,
+                "meta_tags": meta_tags,
+                "article_count": article_count,
+                "sources_str": sources_str
+            }
+            items_by_key[key].append(email_item)
             
             # Prepare for batch summarization
-            if combined_content.strip():
-                texts_to_summarize.append(combined_content)
-                items_to_summarize.append({
-                    "headline": headline,
-                    "meta_tags": meta_tags,
-                    "article_count": article_count,
-                    "sources_str": sources_str
-                })
+            if combined_content:
+                text_idx = text_indices.setdefault(combined_content, len(texts_to_summarize))
+                if text_idx == len(texts_to_summarize):
+                    texts_to_summarize.append(combined_content)
+                items_to_summarize.append(email_item)
+                item_text_indices.append(text_idx)
+                keys_to_summarize.add(key)
             else:
                 logging.warning(f"No content available for headline: {headline}")
-                items_to_summarize.append({
-                    "headline": headline,
-                    "meta_tags": meta_tags,
-                    "article_count": article_count,
-                    "sources_str": sources_str,
-                    "summary": "Summary not available."
-                })
-        
-        # Generate summaries in batches asynchronously
-        if texts_to_summarize:
-            summaries = await generate_summaries_async(texts_to_summarize)
-            for item, summary in zip(items_to_summarize, summaries):
-                item["summary"] = summary
+                email_item["summary"] = "Summary not available."
+
+    # Generate summaries in batches asynchronously; the time allowed is what the
+    # days would have had with one call each
+    if texts_to_summarize:
+        summaries = await generate_summaries_async(
+            texts_to_summarize, timeout=60 * len(keys_to_summarize)
+        )
+        for item, text_idx in zip(items_to_summarize, item_text_indices):
+            item["summary"] = summaries[text_idx]
+
+    for key, items in items_by_key.items():
+        email_parts.append(f"<h2>{key} ({len(items)} highlights)</h2>\n{divider()}<br>")
 
         # Build the email content with summaries
-        for item in items_to_summarize:
+        for item in items:
             headline = item["headline"]
             summary = item.get('summary', 'Summary not available.')
             meta_tags = item["meta_tags"]
@@ -3345,16 +4466,20 @@ async def prepare_email_content(grouped_headlines: Dict) -> str:
                 headline
             )
             
-            # Build the email content
-            email_content += f"<p>"
-            email_content += f"<strong>{headline}</strong><br>"
-            email_content += f"{summary}<br>"
-            if meta_tags:
-                email_content += f"{meta_tags}<br>"
-            email_content += f"Related Articles: {sources_str} [{article_count}]<br>"
-            email_content += f"Sentiment: {sentiment_score:.2f}, Impact: {impact_score}, Action: {action_score}"
-            email_content += f"</p>"
+            # Build the email content; headlines, summaries and tags are plain
+            # text, so "&", "<" and ">" in them are escaped (sources_str is
+            # already HTML links)
+            meta_tags_line = f"{html.escape(meta_tags, quote=False)}<br>" if meta_tags else ""
+            email_parts.append(
+                f"<p><strong>{html.escape(headline, quote=False)}</strong><br>"
+                f"{html.escape(summary, quote=False)}<br>"
+                f"{meta_tags_line}"
+                f"Related Articles: {sources_str} [{article_count}]<br>"
+                f"Sentiment: {sentiment_score:.2f}, Impact: {impact_score}, Action: {action_score}"
+                f"</p>"
+            )
 
+    email_content = "".join(email_parts)
     if not email_content.strip():
         logging.error("Email content is empty after processing all headlines.")
 
@@ -3363,10 +4488,51 @@ async def prepare_email_content(grouped_headlines: Dict) -> str:
 
 
 
-def send_email(email_content):
+SENDER_EMAIL = "YOUREMAILHERE@EMAILDOTCOM"
+RECEIVER_EMAILS = ("YOUREMAILHERE@EMAILDOTCOM",)
+SMTP_SERVER = "smtp.gmail.com"
+SMTP_PORT = 465
+
+
+# Validation resolves each domain's MX records; the addresses are fixed, so
+# each one is checked once per process
+@lru_cache(maxsize=8)
+def normalized_email(address: str) -> str:
+    return validate_email(address).normalized
+
+
+def warm_email_addresses(addresses) -> None:
+    # Fill normalized_email's cache ahead of send_email, which reports errors
+    for address in addresses:
+        try:
+            normalized_email(address)
+        except EmailNotValidError:
+            pass
+
+
+def connect_smtp(sender_email: str, password: str) -> smtplib.SMTP_SSL:
+    """
+    Opens a TLS connection to the SMTP server and logs in.
+
+    Parameters:
+    - sender_email (str): The account to log in as.
+    - password (str): The account password.
+
+    Returns:
+    - smtplib.SMTP_SSL: The logged-in connection.
+    """
+    context = ssl.create_default_context()
+    server = smtplib.SMTP_SSL(SMTP_SERVER, SMTP_PORT, context=context)
+    try:
+        server.login(sender_email, password)
+    except BaseException:
+        server.close()
+        raise
+    return server
+
+
+def send_email(email_content, receiver_emails=RECEIVER_EMAILS, server=None):
     logging.info("Preparing to send email...")
-    sender_email = "YOUREMAILHERE@EMAILDOTCOM"
-    receiver_email = "YOUREMAILHERE@EMAILDOTCOM"
     password = os.environ.get("EMAIL_PASSWORD")
 
     if not password:
@@ -3376,33 +4542,38 @@ def send_email(email_content):
         return False
 
     try:
-        validate_email(sender_email)
-        validate_email(receiver_email)
+        sender_email = normalized_email(SENDER_EMAIL)
+        receiver_emails = [normalized_email(address) for address in receiver_emails]
     except EmailNotValidError as e:
         logging.error(f"Email validation error: {e}")
         return False
 
-    message = MIMEMultipart("alternative")
-    current_datetime = datetime.now(ZoneInfo("America/Chicago")).strftime(
+    # The email has only the HTML part, so it is sent as a single-part message
+    # with no multipart boundaries
+    message = MIMEText(email_content, "html")
+    current_datetime = datetime.now(CENTRAL_TZ).strftime(
         "%A, %B %d, %Y"
     )
     message["Subject"] = f"Meridian Insights // {current_datetime}"
     message["From"] = sender_email
-    message["To"] = receiver_email
-
-    part = MIMEText(email_content, "html")
-    message.attach(part)
+    message["To"] = ", ".join(receiver_emails)
+    # Serialized once and sent to every recipient in a single transaction
+    message_bytes = message.as_bytes()
 
     logging.info("Sending email...")
     try:
-        smtp_server = "smtp.gmail.com"
-        smtp_port = 465
-
-        context = ssl.create_default_context()
-
-        with smtplib.SMTP_SSL(smtp_server, smtp_port, context=context) as server:
-            server.login(sender_email, password)
-            server.sendmail(sender_email, receiver_email, message.as_string())
+        if server is not None:
+            try:
+                with server:
+                    server.sendmail(sender_email, receiver_emails, message_bytes)
+                logging.info("Email sent successfully.")
+                return True
+            except smtplib.SMTPServerDisconnected:
+                # A connection opened ahead of time can idle out during a long run
+                logging.warning("SMTP connection was closed, reconnecting...")
+
+        with connect_smtp(sender_email, password) as server:
+            server.sendmail(sender_email, receiver_emails, message_bytes)
         logging.info("Email sent successfully.")
         return True
     except Exception as e:
@@ -3410,6 +4581,49 @@ def send_email(email_content):
         return False
 
 
+async def prepare_and_send_email(grouped_headlines: Dict) -> bool:
+    # The TLS handshake and login don't depend on the email, so they run in a
+    # worker thread while the summaries are being generated
+    password = os.environ.get("EMAIL_PASSWORD")
+    smtp_task = None
+    if password:
+        smtp_task = asyncio.create_task(
+            asyncio.to_thread(connect_smtp, SENDER_EMAIL, password)
+        )
+    # Likewise the DNS lookups behind address validation
+    validation_task = asyncio.create_task(
+        asyncio.to_thread(warm_email_addresses, (SENDER_EMAIL, *RECEIVER_EMAILS))
+    )
+
+    try:
+        email_content = await prepare_email_content(grouped_headlines)
+    except BaseException:
+        # Don't leave the early connection logged in, or its task's exception
+        # unretrieved
+        if smtp_task is not None:
+            try:
+                server = await smtp_task
+            except Exception:
+                pass
+            else:
+                try:
+                    server.quit()
+                except OSError:
+                    server.close()
+        await validation_task
+        raise
+
+    server = None
+    if smtp_task is not None:
+        try:
+            server = await smtp_task
+        except Exception as e:
+            logging.warning(f"Could not connect to the SMTP server early: {e}")
+    await validation_task
+
+    return await asyncio.to_thread(send_email, email_content, server=server)
+
+
 def main():
     initialize_resources()
 
@@ -3423,9 +4637,7 @@ def main():
 
     grouped_headlines = group_headlines(aggregated_headlines)
 
-    email_content = asyncio.run(prepare_email_content(grouped_headlines))
-
-    email_sent = send_email(email_content)
+    email_sent = asyncio.run(prepare_and_send_email(grouped_headlines))
 
     if email_sent:
         logging.info("Script execution completed successfully.")
@@ -0,0 +1,7 @@
+"""
+Utility helpers shared across the Meridian package.
+"""
+
+from ._lazy import lazy_import
+
+__all__ = ["lazy_import"]
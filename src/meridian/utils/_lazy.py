@@ -0,0 +1,32 @@
+"""
+Module proxies that defer heavyweight third-party imports until first use.
+"""
+
+import importlib
+
+
+class _LazyModule:
+    """Stands in for a module and imports it on the first attribute access."""
+
+    __slots__ = ("_name", "_mod")
+
+    def __init__(self, name: str):
+        self._name = name
+        self._mod = None
+
+    def __getattr__(self, attr):
+        if self._mod is None:
+            self._mod = importlib.import_module(self._name)
+        return getattr(self._mod, attr)
+
+    def __repr__(self) -> str:
+        state = "loaded" if self._mod is not None else "not yet loaded"
+        return f"<lazy module {self._name!r} ({state})>"
+
+
+def lazy_import(name: str) -> _LazyModule:
+    """
+    Returns a proxy for the module `name` that is imported on first use, e.g.
+    `np = lazy_import("numpy")` at module scope costs nothing until `np.array`.
+    """
+    return _LazyModule(name)
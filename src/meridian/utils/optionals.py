@@ -0,0 +1,121 @@
+"""
+Lazy availability checks for Meridian's heavyweight optional dependencies.
+
+Each ``HAS_X`` object only looks for its module when it is first tested for
+truthiness, so importing this module never imports the dependency itself:
+
+    from meridian.utils.optionals import HAS_SKLEARN
+
+    if HAS_SKLEARN:
+        from sklearn.cluster import DBSCAN
+"""
+
+import functools
+import importlib.util
+
+
+class MissingOptionalLibraryError(ImportError):
+    """Raised when a feature needs an optional library that is not installed."""
+
+    def __init__(self, libname: str, name: str, pip_install: str = None):
+        message = f"The '{libname}' library is required to use '{name}'."
+        if pip_install:
+            message += f" You can install it with '{pip_install}'."
+        super().__init__(message)
+        self.libname = libname
+        self.name = name
+        self.pip_install = pip_install
+
+
+class LazyImportTester:
+    """
+    Tests whether a module can be imported, deferring the check until the tester
+    is first evaluated and caching the result for the rest of the process.
+
+    Parameters:
+    - module (str): The top-level module name to look for.
+    - name (str, optional): A human-readable library name for error messages.
+    - install (str, optional): The pip command that installs the library.
+    """
+
+    def __init__(self, module: str, *, name: str = None, install: str = None):
+        self._module = module
+        self._name = name or module
+        self._install = install
+        self._available = None
+
+    def __bool__(self) -> bool:
+        if self._available is None:
+            try:
+                self._available = importlib.util.find_spec(self._module) is not None
+            except ImportError:
+                # A dotted module whose parent package is missing
+                self._available = False
+        return self._available
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} for {self._module!r}>"
+
+    def require_now(self, feature: str) -> None:
+        """Raise MissingOptionalLibraryError if the module is not available."""
+        if not self:
+            raise MissingOptionalLibraryError(self._name, feature, self._install)
+
+    def require_in_call(self, feature_or_callable=None):
+        """
+        Decorator that checks availability each time the wrapped function is called.
+
+        Can be used bare (``@HAS_X.require_in_call``) or with an explicit feature
+        name for the error message (``@HAS_X.require_in_call("clustering")``).
+        """
+        if callable(feature_or_callable):
+            return self.require_in_call(feature_or_callable.__qualname__)(feature_or_callable)
+
+        def decorator(function):
+            feature = feature_or_callable or function.__qualname__
+
+            @functools.wraps(function)
+            def wrapper(*args, **kwargs):
+                self.require_now(feature)
+                return function(*args, **kwargs)
+
+            return wrapper
+
+        return decorator
+
+
+HAS_FEEDPARSER = LazyImportTester(
+    "feedparser", install="pip install meridian-news-aggregator"
+)
+HAS_AHOCORASICK = LazyImportTester(
+    "ahocorasick", name="pyahocorasick", install="pip install meridian-news-aggregator[speedups]"
+)
+HAS_CLD3 = LazyImportTester("cld3", name="pycld3", install="pip install pycld3")
+HAS_HNSWLIB = LazyImportTester(
+    "hnswlib", install="pip install meridian-news-aggregator[ann]"
+)
+HAS_LXML = LazyImportTester("lxml", install="pip install lxml")
+HAS_OPTIMUM = LazyImportTester(
+    "optimum.onnxruntime", name="optimum[onnxruntime]", install="pip install meridian-news-aggregator[onnx]"
+)
+HAS_SELECTOLAX = LazyImportTester(
+    "selectolax.lexbor", name="selectolax", install="pip install meridian-news-aggregator[speedups]"
+)
+HAS_SCIPY = LazyImportTester(
+    "scipy", name="SciPy", install="pip install meridian-news-aggregator[cluster]"
+)
+HAS_SKLEARN = LazyImportTester(
+    "sklearn", name="scikit-learn", install="pip install meridian-news-aggregator[cluster]"
+)
+HAS_TORCH = LazyImportTester(
+    "torch", name="PyTorch", install="pip install meridian-news-aggregator[embed]"
+)
+HAS_UVLOOP = LazyImportTester(
+    "uvloop", install="pip install meridian-news-aggregator[speedups]"
+)
+HAS_TRANSFORMERS = LazyImportTester(
+    "transformers", install="pip install meridian-news-aggregator[embed]"
+)
+HAS_SENTENCE_TRANSFORMERS = LazyImportTester(
+    "sentence_transformers", name="sentence-transformers", install="pip install meridian-news-aggregator[embed]"
+)
@@ -0,0 +1,51 @@
+"""`import meridian` must stay cheap: no heavyweight dependency may load with it."""
+
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+SRC = Path(__file__).resolve().parents[1] / "src"
+
+# Top-level packages that must only be imported once a pipeline stage needs them
+FORBIDDEN = [
+    "feedparser",
+    "matplotlib",
+    "nltk",
+    "numpy",
+    "scipy",
+    "sentence_transformers",
+    "sklearn",
+    "spacy",
+    "torch",
+    "transformers",
+]
+
+# Each -X importtime line ends with the (indented) module name
+_IMPORTTIME_RE = re.compile(r"^import time:.*\|\s+([\w.]+)$", re.MULTILINE)
+
+
+def loaded_modules(statement):
+    # Import the checkout under test rather than whatever is installed
+    pythonpath = [str(SRC), os.environ.get("PYTHONPATH")]
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, pythonpath)))
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+        check=True,
+        env=env,
+    )
+    return set(_IMPORTTIME_RE.findall(result.stderr))
+
+
+def test_import_meridian_skips_heavy_modules():
+    loaded = loaded_modules("import meridian")
+    assert "meridian" in loaded
+    banned = sorted(
+        name for name in FORBIDDEN
+        if any(mod == name or mod.startswith(name + ".") for mod in loaded)
+    )
+    assert not banned, f"Heavy modules imported by 'import meridian': {', '.join(banned)}"
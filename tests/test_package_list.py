@@ -0,0 +1,24 @@
+"""The package list hardcoded in pyproject.toml must match what setuptools
+would discover under src/."""
+
+import sys
+from pathlib import Path
+
+import pytest
+from setuptools import find_packages
+
+if sys.version_info >= (3, 11):
+    import tomllib
+else:
+    tomllib = pytest.importorskip("tomli")
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def test_declared_packages_match_discovered():
+    with open(ROOT / "pyproject.toml", "rb") as f:
+        declared = set(tomllib.load(f)["tool"]["setuptools"]["packages"])
+    discovered = set(find_packages(where=str(ROOT / "src")))
+
+    assert not discovered - declared, "Missing from pyproject.toml"
+    assert not declared - discovered, "Listed in pyproject.toml but not found"